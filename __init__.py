@@ -4,55 +4,82 @@ D&D System - Complete 5e 2024 Rules Implementation
 Global access point for all D&D mechanics and systems.
 """
 
-# Core utilities - globally accessible
-from core import (
-    roll_dice, roll_d20, roll_d6, roll_d8, roll_d10, roll_d12,
-    roll_advantage, roll_disadvantage, get_ability_modifier,
-    roll_hit_die, is_valid_dice_notation, parse_dice_notation
-)
-
-# Base classes
-from creatures.base import Creature
-
-# System managers - including range and positioning
-from systems import (
+import importlib
+
+# Public names resolved on first access (PEP 562), so importing the package
+# does not pull in every subsystem up front. Maps name -> defining module.
+_LAZY_IMPORTS = {
+    # Core utilities - globally accessible
+    'roll_dice': 'core.utils', 'roll_dice_batch': 'core.utils', 'roll_parsed_dice': 'core.utils',
+    'roll_d20': 'core.utils', 'roll_d6': 'core.utils',
+    'roll_d8': 'core.utils', 'roll_d10': 'core.utils', 'roll_d12': 'core.utils',
+    'roll_advantage': 'core.utils', 'roll_disadvantage': 'core.utils',
+    'get_ability_modifier': 'core.utils', 'roll_hit_die': 'core.utils',
+    'is_valid_dice_notation': 'core.utils', 'parse_dice_notation': 'core.utils',
+
+    # Base classes
+    'Creature': 'creatures.base',
+
+    # Narration / logging configuration
+    'configure_logging': 'error_handling.logging_setup',
+
     # Core systems
-    perform_d20_test, was_last_roll_critical,
-    AttackSystem, WeaponRanges,
-    add_condition, remove_condition, has_condition,
-    
+    'perform_d20_test': 'systems.d20_system', 'was_last_roll_critical': 'systems.d20_system',
+    'AttackSystem': 'systems.attack_system', 'WeaponRanges': 'systems.attack_system',
+    'WeaponData': 'systems.attack_system',
+    'add_condition': 'systems.condition_system', 'remove_condition': 'systems.condition_system',
+    'has_condition': 'systems.condition_system',
+
     # Combat systems
-    combat_manager,
-    
+    'combat_manager': 'systems.combat_manager',
+
     # Spell systems
-    SpellManager,
-    
+    'SpellManager': 'systems.spell_system.spell_manager',
+
     # Range and positioning systems
-    battlefield, Position, CreatureSize,
-    RangeSystem, CoverSystem,
-    
+    'battlefield': 'systems.positioning_system', 'Position': 'systems.positioning_system',
+    'CreatureSize': 'systems.positioning_system',
+    'RangeSystem': 'systems.cover_system', 'CoverSystem': 'systems.cover_system',
+
     # Concentration system
-    ConcentrationSystem,
-    
+    'ConcentrationSystem': 'systems.concentration_system',
+
     # Enhanced condition system
-    DurationType
-)
+    'DurationType': 'systems.condition_system',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # Global imports for convenience
 __all__ = [
     # Dice and utilities
-    'roll_dice', 'roll_d20', 'roll_d6', 'roll_d8', 'roll_d10', 'roll_d12',
+    'roll_dice', 'roll_dice_batch', 'roll_parsed_dice', 'roll_d20', 'roll_d6', 'roll_d8', 'roll_d10', 'roll_d12',
     'roll_advantage', 'roll_disadvantage', 'get_ability_modifier', 'roll_hit_die',
     
     # Base classes
     'Creature',
     
+    # Logging
+    'configure_logging',
+    
     # Core system functions
     'perform_d20_test', 'was_last_roll_critical',
     'add_condition', 'remove_condition', 'has_condition',
     
     # System managers
-    'AttackSystem', 'WeaponRanges', 'combat_manager', 'SpellManager',
+    'AttackSystem', 'WeaponRanges', 'WeaponData', 'combat_manager', 'SpellManager',
     
     # Range and positioning
     'battlefield', 'Position', 'CreatureSize', 'RangeSystem', 'CoverSystem',
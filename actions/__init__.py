@@ -0,0 +1,23 @@
+"""Action registry - one canonical module per action, re-exported for global access."""
+
+from .attack_action import AttackAction, WeaponAttackAction, UnarmedAttackAction
+from .dash_action import DashAction, DASH_ACTION
+from .disengage_action import DisengageAction, DISENGAGE_ACTION
+from .dodge_action import DodgeAction, DODGE_ACTION
+from .help_action import HelpAction
+from .hide_action import HideAction
+from .influence_action import InfluenceAction
+from .insight_action import InsightAction
+from .ready_action import ReadyAction
+from .search_action import SearchAction
+from .spell_actions import CastSpellAction
+from .study_action import StudyAction
+from .utilize_action import UtilizeAction
+
+__all__ = [
+    'AttackAction', 'WeaponAttackAction', 'UnarmedAttackAction',
+    'DashAction', 'DisengageAction', 'DodgeAction', 'HelpAction',
+    'HideAction', 'InfluenceAction', 'InsightAction', 'ReadyAction',
+    'SearchAction', 'CastSpellAction', 'StudyAction', 'UtilizeAction',
+    'DASH_ACTION', 'DISENGAGE_ACTION', 'DODGE_ACTION'
+]
\ No newline at end of file
@@ -0,0 +1,41 @@
+# File: actions/_skill_tables.py
+"""Shared skill lookup tables for the skill-check actions (Influence, Search, Study, Hide)."""
+import sys
+
+# D&D 2024 skill -> governing ability
+SKILL_ABILITIES = {
+    'acrobatics': 'dex',
+    'animal_handling': 'wis',
+    'arcana': 'int',
+    'athletics': 'str',
+    'deception': 'cha',
+    'history': 'int',
+    'insight': 'wis',
+    'intimidation': 'cha',
+    'investigation': 'int',
+    'medicine': 'wis',
+    'nature': 'int',
+    'perception': 'wis',
+    'performance': 'cha',
+    'persuasion': 'cha',
+    'religion': 'int',
+    'sleight_of_hand': 'dex',
+    'stealth': 'dex',
+    'survival': 'wis',
+}
+
+# Caller spelling -> interned lower-case skill name, filled in on first use
+_CANONICAL_SKILLS = {skill: skill for skill in SKILL_ABILITIES}
+
+def canonical_skill(skill):
+    """Return the interned lower-case form of a skill name (e.g. 'Persuasion' -> 'persuasion')."""
+    try:
+        return _CANONICAL_SKILLS[skill]
+    except KeyError:
+        canonical = sys.intern(skill.lower())
+        _CANONICAL_SKILLS[skill] = canonical
+        return canonical
+
+def skill_ability(skill, default):
+    """Get the ability a canonical skill name is checked with."""
+    return SKILL_ABILITIES.get(skill, default)
\ No newline at end of file
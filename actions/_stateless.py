@@ -0,0 +1,18 @@
+# File: actions/_stateless.py
+"""Shared-instance base for actions that carry no per-use state (Dash, Dodge, Disengage)."""
+
+
+class StatelessAction:
+    """
+    Constructing a subclass returns that class's shared instance. The instance is
+    looked up in the class's own __dict__, so a subclass gets its own instance
+    rather than inheriting its parent's.
+    """
+    __slots__ = ()
+
+    def __new__(cls):
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super().__new__(cls)
+            cls._instance = instance
+        return instance
\ No newline at end of file
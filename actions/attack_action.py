@@ -1,19 +1,33 @@
 # File: actions/attack_action.py
 """Consolidated Attack Actions - Single source of truth for all attack actions."""
-from systems.attack_system import AttackSystem
-from error_handling import DnDErrorHandler
+import functools
+import logging
+from core.utils import parse_dice_notation
+from systems.attack_system import AttackSystem, WeaponData, UNARMED_STRIKE
+
+logger = logging.getLogger('dnd.actions')
 
 class AttackAction:
     """Base attack action class."""
     def __init__(self, weapon_data=None):
         self.name = "Attack"
-        self.weapon_data = weapon_data or {
-            'name': 'Unarmed Strike',
-            'damage': '1+0',
-            'ability': 'str',
-            'proficient': True,
-            'damage_type': 'bludgeoning'
-        }
+        if not weapon_data:
+            weapon_data = UNARMED_STRIKE
+        elif isinstance(weapon_data, dict):
+            weapon_data = WeaponData.from_dict(weapon_data)
+        self.weapon_data = weapon_data
+        
+        # Resolve the attack routine once so execute() doesn't re-check the weapon name per swing
+        if weapon_data.name.lower() == 'unarmed strike':
+            self._attack = AttackSystem.make_unarmed_attack
+        else:
+            # Parse the damage dice once; notation roll_dice can't parse is left to AttackSystem
+            try:
+                damage_spec = parse_dice_notation(weapon_data.damage)
+            except ValueError:
+                damage_spec = None
+            self._attack = functools.partial(AttackSystem.make_weapon_attack, weapon_data=self.weapon_data,
+                                             damage_spec=damage_spec)
 
     def execute(self, performer, target=None):
         """
@@ -21,26 +35,16 @@ class AttackAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         if not target:
-            print(f"  > {performer.name} needs a target to attack!")
+            logger.debug("  > %s needs a target to attack!", performer.name)
             return False
         
         # Use the existing attack system with error handling
-        if self.weapon_data['name'].lower() == 'unarmed strike':
-            return AttackSystem.make_unarmed_attack(performer, target)
-        else:
-            return AttackSystem.make_weapon_attack(performer, target, self.weapon_data)
+        return self._attack(performer, target)
 
 class WeaponAttackAction(AttackAction):
     """Specific weapon attack action."""
     def __init__(self, weapon_name, damage_dice, ability='str', damage_type='slashing'):
-        weapon_data = {
-            'name': weapon_name,
-            'damage': damage_dice,
-            'ability': ability,
-            'proficient': True,
-            'damage_type': damage_type
-        }
-        super().__init__(weapon_data)
+        super().__init__(WeaponData(weapon_name, damage_dice, ability, True, damage_type))
         self.name = f"Attack with {weapon_name}"
 
 class UnarmedAttackAction(AttackAction):
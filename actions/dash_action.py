@@ -1,8 +1,15 @@
 # File: actions/dash_action.py
 """Implementation of the Dash action."""
+import logging
+from actions._stateless import StatelessAction
+
+# Narration is emitted at DEBUG so headless simulations skip it entirely
+logger = logging.getLogger('dnd.actions')
+
+class DashAction(StatelessAction):
+    """Represents the Dash action; every construction returns the shared instance."""
+    __slots__ = ('name',)
 
-class DashAction:
-    """Represents the Dash action."""
     def __init__(self):
         self.name = "Dash"
 
@@ -15,6 +22,10 @@ class DashAction:
         extra_movement = performer.speed
         
         performer.movement_for_turn += extra_movement
-        print(f"  > {performer.name} gains {extra_movement} feet of extra movement.")
-        print(f"  > Total movement for this turn: {performer.movement_for_turn} feet.")
-        return True
\ No newline at end of file
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  > %s gains %s feet of extra movement.", performer.name, extra_movement)
+            logger.debug("  > Total movement for this turn: %s feet.", performer.movement_for_turn)
+        return True
+
+
+DASH_ACTION = DashAction()
\ No newline at end of file
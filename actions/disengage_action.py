@@ -1,8 +1,14 @@
 # File: actions/disengage_action.py
 """Implementation of the Disengage action."""
+import logging
+from actions._stateless import StatelessAction
+
+logger = logging.getLogger('dnd.actions')
+
+class DisengageAction(StatelessAction):
+    """Represents the Disengage action; every construction returns the shared instance."""
+    __slots__ = ('name',)
 
-class DisengageAction:
-    """Represents the Disengage action."""
     def __init__(self):
         self.name = "Disengage"
 
@@ -12,5 +18,8 @@ class DisengageAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         performer.is_disengaging = True
-        print(f"  > {performer.name}'s movement will not provoke opportunity attacks this turn.")
-        return True
\ No newline at end of file
+        logger.debug("  > %s's movement will not provoke opportunity attacks this turn.", performer.name)
+        return True
+
+
+DISENGAGE_ACTION = DisengageAction()
\ No newline at end of file
@@ -1,8 +1,14 @@
 # File: actions/dodge_action.py
 """Implementation of the Dodge action."""
+import logging
+from actions._stateless import StatelessAction
+
+logger = logging.getLogger('dnd.actions')
+
+class DodgeAction(StatelessAction):
+    """Represents the Dodge action; every construction returns the shared instance."""
+    __slots__ = ('name',)
 
-class DodgeAction:
-    """Represents the Dodge action."""
     def __init__(self):
         self.name = "Dodge"
 
@@ -12,5 +18,8 @@ class DodgeAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         performer.is_dodging = True
-        print(f"  > {performer.name} is now dodging. Attacks against them have disadvantage.")
-        return True
\ No newline at end of file
+        logger.debug("  > %s is now dodging. Attacks against them have disadvantage.", performer.name)
+        return True
+
+
+DODGE_ACTION = DodgeAction()
\ No newline at end of file
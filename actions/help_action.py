@@ -1,5 +1,9 @@
 # File: actions/help_action.py
 """Implementation of the Help action, with its two distinct uses."""
+import logging
+from actions._skill_tables import canonical_skill
+
+logger = logging.getLogger('dnd.actions')
 
 class HelpAction:
     """Represents the Help action."""
@@ -13,8 +17,9 @@ class HelpAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         # A full implementation would check the 5-foot range here.
-        ally.help_effects['attack_advantage_against'] = target_enemy
-        print(f"  > {performer.name} distracts {target_enemy.name}, preparing to help {ally.name}.")
+        ally.help_attack_target = target_enemy
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  > %s distracts %s, preparing to help %s.", performer.name, target_enemy.name, ally.name)
         return True
 
     def assist_ability_check(self, performer, target_ally, skill_or_tool):
@@ -24,19 +29,36 @@ class HelpAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         # A full implementation would check if the performer is proficient in the skill.
-        target_ally.help_effects['ability_check_advantage_on'] = skill_or_tool.lower()
-        print(f"  > {performer.name} prepares to help {target_ally.name} with their next '{skill_or_tool}' check.")
+        target_ally.help_skill = canonical_skill(skill_or_tool)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  > %s prepares to help %s with their next '%s' check.", performer.name, target_ally.name, skill_or_tool)
         return True
     
+    def _help_attack(self, performer, target, ally, skill):
+        if target and ally:
+            return self.assist_attack_roll(performer, target, ally)
+        return None
+
+    def _help_ability(self, performer, target, ally, skill):
+        if ally and skill:
+            return self.assist_ability_check(performer, ally, skill)
+        return None
+
+    # help_type -> variant handler; handlers return None when their arguments are missing
+    _VARIANTS = {
+        'attack': _help_attack,
+        'ability': _help_ability,
+    }
+
     def execute(self, performer, target=None, help_type="attack", ally=None, skill=None):
         """
         Execute the Help action with different variants.
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
-        if help_type == "attack" and target and ally:
-            return self.assist_attack_roll(performer, target, ally)
-        elif help_type == "ability" and ally and skill:
-            return self.assist_ability_check(performer, ally, skill)
-        else:
-            print(f"  > {performer.name} helps an ally (generic help).")
-            return True
\ No newline at end of file
+        variant = self._VARIANTS.get(help_type)
+        if variant is not None:
+            result = variant(self, performer, target, ally, skill)
+            if result is not None:
+                return result
+        logger.debug("  > %s helps an ally (generic help).", performer.name)
+        return True
\ No newline at end of file
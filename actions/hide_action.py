@@ -1,7 +1,13 @@
 # File: actions/hide_action.py
 """Implementation of the Hide action."""
+import logging
 from systems.d20_system import perform_d20_test
 
+logger = logging.getLogger('dnd.actions')
+
+# Narration templates indexed by the check result (False, True)
+_OUTCOME_NARRATION = ("  > %s failed to hide.", "  > %s is now hidden!")
+
 class HideAction:
     """Represents the Hide action."""
     def __init__(self):
@@ -22,9 +28,6 @@ class HideAction:
             dc=dc_to_beat
         )
         
-        if was_successful:
-            print(f"  > {performer.name} is now hidden!")
-        else:
-            print(f"  > {performer.name} failed to hide.")
+        logger.debug(_OUTCOME_NARRATION[was_successful], performer.name)
 
         return was_successful
\ No newline at end of file
@@ -1,6 +1,13 @@
 # File: actions/influence_action.py
 """Implementation of the Influence action."""
+import logging
 from systems.d20_system import perform_d20_test
+from actions._skill_tables import canonical_skill, skill_ability
+
+logger = logging.getLogger('dnd.actions')
+
+# Narration templates indexed by the check result (False, True)
+_OUTCOME_NARRATION = ("  > %s's attempt to influence %s failed.", "  > %s's attempt to influence %s succeeded!")
 
 class InfluenceAction:
     """Represents the Influence action, which uses various Charisma or Wisdom skills."""
@@ -13,20 +20,19 @@ class InfluenceAction:
         Now uses integrated social interaction mechanics.
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
-        ability = 'wis' if skill_to_use.lower() == 'animal_handling' else 'cha'
+        skill = canonical_skill(skill_to_use)
+        # Influence skills are Charisma-based, except Wisdom (Animal Handling)
+        ability = skill_ability(skill, 'cha')
         
         was_successful = perform_d20_test(
             creature=performer,
             ability_name=ability,
-            check_type=skill_to_use.lower(),
+            check_type=skill,
             dc=dc_to_beat,
             target=target,
-            social_interaction_type=skill_to_use.lower()  # Use integrated social system
+            social_interaction_type=skill  # Use integrated social system
         )
         
-        if was_successful:
-            print(f"  > {performer.name}'s attempt to influence {target.name} succeeded!")
-        else:
-            print(f"  > {performer.name}'s attempt to influence {target.name} failed.")
+        logger.debug(_OUTCOME_NARRATION[was_successful], performer.name, target.name)
 
         return was_successful
\ No newline at end of file
@@ -1,6 +1,28 @@
 # File: actions/insight_action.py
 """Implementation of the Insight action for reading NPCs."""
+import logging
 from systems.d20_system import perform_d20_test
+from creatures.base import ABILITY_INDEX
+
+logger = logging.getLogger('dnd.actions')
+
+# Phrases revealed by a successful Insight check, in the order they are reported
+_INSIGHT_PHRASES = (
+    "they seem hostile and aggressive",
+    "they appear genuinely friendly and helpful",
+    "they seem neutral and cautious",
+    "they look injured or weakened",
+    "they are clearly afraid of something",
+    "their behavior seems unnatural, possibly charmed",
+    "they carry themselves with confidence",
+    "they seem awkward or uncomfortable in social situations",
+    "they appear perceptive and alert",
+)
+(_HOSTILE, _FRIENDLY, _NEUTRAL, _INJURED, _FRIGHTENED,
+ _CHARMED, _CONFIDENT, _AWKWARD, _PERCEPTIVE) = (1 << bit for bit in range(len(_INSIGHT_PHRASES)))
+
+_CHA = ABILITY_INDEX['cha']
+_WIS = ABILITY_INDEX['wis']
 
 class InsightAction:
     """Represents making an Insight check to read NPCs and situations."""
@@ -13,9 +35,9 @@ class InsightAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         if target:
-            print(f"  > {performer.name} studies {target.name}, trying to read their intentions...")
+            logger.debug("  > %s studies %s, trying to read their intentions...", performer.name, target.name)
         else:
-            print(f"  > {performer.name} tries to gain insight into the situation...")
+            logger.debug("  > %s tries to gain insight into the situation...", performer.name)
         
         # Make a Wisdom (Insight) check
         was_successful = perform_d20_test(
@@ -30,46 +52,55 @@ class InsightAction:
                 # Reveal information about the target's emotional state
                 self._reveal_npc_insights(performer, target)
             else:
-                print(f"  > {performer.name} gains valuable insight into the situation!")
+                logger.debug("  > %s gains valuable insight into the situation!", performer.name)
         else:
-            print(f"  > {performer.name} cannot read the situation clearly.")
+            logger.debug("  > %s cannot read the situation clearly.", performer.name)
 
         return was_successful
     
     def _reveal_npc_insights(self, performer, target):
         """Reveal insights about the target NPC based on their state."""
-        insights = []
-        
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        # Each observation sets one bit; phrases are emitted in bit order
+        mask = 0
+
         # Check target's attitude
         if target.attitude == 'Hostile':
-            insights.append("they seem hostile and aggressive")
+            mask |= _HOSTILE
         elif target.attitude == 'Friendly':
-            insights.append("they appear genuinely friendly and helpful")
+            mask |= _FRIENDLY
         else:
-            insights.append("they seem neutral and cautious")
-        
+            mask |= _NEUTRAL
+
         # Check target's health
         if target.current_hp < target.max_hp * 0.5:
-            insights.append("they look injured or weakened")
-        
+            mask |= _INJURED
+
         # Check for conditions
-        if hasattr(target, 'conditions') and target.conditions:
-            if 'frightened' in target.conditions:
-                insights.append("they are clearly afraid of something")
-            if 'charmed' in target.conditions:
-                insights.append("their behavior seems unnatural, possibly charmed")
-        
+        conditions = getattr(target, 'conditions', None)
+        if conditions:
+            if 'frightened' in conditions:
+                mask |= _FRIGHTENED
+            if 'charmed' in conditions:
+                mask |= _CHARMED
+
         # Check stats for personality insights
-        if target.stats.get('cha', 10) >= 14:
-            insights.append("they carry themselves with confidence")
-        elif target.stats.get('cha', 10) <= 8:
-            insights.append("they seem awkward or uncomfortable in social situations")
-        
-        if target.stats.get('wis', 10) >= 14:
-            insights.append("they appear perceptive and alert")
-        
-        if insights:
-            insight_text = ", and ".join(insights)
-            print(f"  > {performer.name} senses that {insight_text}.")
+        scores = target.ability_scores
+        cha = scores[_CHA]
+        if cha >= 14:
+            mask |= _CONFIDENT
+        elif cha <= 8:
+            mask |= _AWKWARD
+
+        if scores[_WIS] >= 14:
+            mask |= _PERCEPTIVE
+
+        if mask:
+            insight_text = ", and ".join(
+                phrase for bit, phrase in enumerate(_INSIGHT_PHRASES) if mask >> bit & 1
+            )
+            logger.debug("  > %s senses that %s.", performer.name, insight_text)
         else:
-            print(f"  > {performer.name} gets a general read on {target.name} but nothing specific stands out.")
\ No newline at end of file
+            logger.debug("  > %s gets a general read on %s but nothing specific stands out.", performer.name, target.name)
\ No newline at end of file
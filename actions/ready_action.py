@@ -1,5 +1,10 @@
 # File: actions/ready_action.py
 """Implementation of the Ready action with concentration support."""
+import logging
+from systems.concentration_system import ConcentrationSystem
+from systems.action_execution_system import ActionExecutionSystem, ActionType
+
+logger = logging.getLogger('dnd.actions')
 
 class ReadyAction:
     """Represents the Ready action with D&D 2024 concentration rules."""
@@ -12,14 +17,11 @@ class ReadyAction:
         Handles spell concentration according to D&D 2024 rules.
         """
         # Handle spell readying with concentration
-        if hasattr(action_to_ready, 'spell') and action_to_ready.spell:
-            spell = action_to_ready.spell
-            
+        spell = getattr(action_to_ready, 'spell', None)
+        if spell is not None:
             # Check if it's a concentration spell
-            if hasattr(spell, 'concentration') and spell.concentration:
-                from systems.concentration_system import ConcentrationSystem
-                
-                print(f"  > {performer.name} readies {spell.name} (concentration required)")
+            if getattr(spell, 'concentration', False):
+                logger.debug("  > %s readies %s (concentration required)", performer.name, spell.name)
                 
                 # Start concentration for readied spell (until next turn)
                 if not ConcentrationSystem.start_concentration(
@@ -27,19 +29,16 @@ class ReadyAction:
                     getattr(action_to_ready, 'spell_level', 1),
                     {'readied_spell': True, 'spell': spell, 'target': target}
                 ):
-                    print(f"  > {performer.name} cannot maintain concentration to ready {spell.name}")
+                    logger.debug("  > %s cannot maintain concentration to ready %s", performer.name, spell.name)
                     return False
         
-        # Initialize readied_action if it doesn't exist
-        if not hasattr(performer, 'readied_action'):
-            performer.readied_action = {}
+        performer.readied_trigger = trigger_description
+        performer.readied_action_obj = action_to_ready
+        performer.readied_target = target
         
-        performer.readied_action['trigger'] = trigger_description
-        performer.readied_action['action'] = action_to_ready
-        performer.readied_action['target'] = target
-        
-        print(f"  > {performer.name} is now waiting for: '{trigger_description}'")
-        print(f"  > They will respond by using the '{action_to_ready.name}' action.")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  > %s is now waiting for: '%s'", performer.name, trigger_description)
+            logger.debug("  > They will respond by using the '%s' action.", action_to_ready.name)
         return True
     
     @staticmethod
@@ -54,46 +53,34 @@ class ReadyAction:
         Returns:
             bool: True if action was triggered successfully
         """
-        if not hasattr(performer, 'readied_action') or not performer.readied_action:
+        action = getattr(performer, 'readied_action_obj', None)
+        if action is None or not trigger_met:
             return False
         
-        if not trigger_met:
-            return False
+        target = performer.readied_target
         
-        try:
-            from systems.concentration_system import ConcentrationSystem
-            
-            readied_data = performer.readied_action
-            action = readied_data.get('action')
-            target = readied_data.get('target')
-            
-            print(f"  > {performer.name}'s readied action triggers!")
-            
-            # Execute the readied action
-            from systems.action_execution_system import ActionExecutionSystem, ActionType
-            success = ActionExecutionSystem.execute_action(
-                performer, action, ActionType.REACTION, target
-            )
-            
-            # Clear the readied action
-            performer.readied_action = {}
-            
-            # If it was a concentration spell, concentration transfers to the actual spell effect
-            if hasattr(action, 'spell') and action.spell:
-                spell = action.spell
-                if hasattr(spell, 'concentration') and spell.concentration:
-                    # The concentration now applies to the actual spell effect
-                    duration = getattr(spell, 'duration', '1 minute')
-                    duration_seconds = ConcentrationSystem.parse_duration(duration)
-                    
-                    ConcentrationSystem.start_concentration(
-                        performer, spell.name, duration_seconds,
-                        getattr(action, 'spell_level', 1),
-                        {'spell': spell, 'target': target}
-                    )
-            
-            return success
-            
-        except Exception as e:
-            print(f"  > ERROR: Could not trigger readied action - {str(e)}")
-            return False
\ No newline at end of file
+        logger.debug("  > %s's readied action triggers!", performer.name)
+        
+        # Execute the readied action; ActionExecutionSystem handles failures inside the action itself
+        success = ActionExecutionSystem.execute_action(
+            performer, action, ActionType.REACTION, target
+        )
+        
+        # Clear the readied action
+        performer.clear_readied_action()
+        
+        # If it was a concentration spell, concentration transfers to the actual spell effect
+        spell = getattr(action, 'spell', None)
+        if spell is not None:
+            if getattr(spell, 'concentration', False):
+                # The concentration now applies to the actual spell effect
+                duration = getattr(spell, 'duration', '1 minute')
+                duration_seconds = ConcentrationSystem.parse_duration(duration)
+                
+                ConcentrationSystem.start_concentration(
+                    performer, spell.name, duration_seconds,
+                    getattr(action, 'spell_level', 1),
+                    {'spell': spell, 'target': target}
+                )
+        
+        return success
\ No newline at end of file
@@ -1,6 +1,13 @@
 # File: actions/search_action.py
 """Implementation of the Search action."""
+import logging
 from systems.d20_system import perform_d20_test
+from actions._skill_tables import canonical_skill
+
+logger = logging.getLogger('dnd.actions')
+
+# Narration templates indexed by the check result (False, True)
+_OUTCOME_NARRATION = ("  > %s found nothing.", "  > %s found something!")
 
 class SearchAction:
     """Represents the Search action, which uses various Wisdom skills."""
@@ -18,13 +25,10 @@ class SearchAction:
         was_successful = perform_d20_test(
             creature=performer,
             ability_name='wis',
-            check_type=skill_to_use.lower(), # e.g., 'perception'
+            check_type=canonical_skill(skill_to_use), # e.g., 'perception'
             dc=dc_to_beat
         )
         
-        if was_successful:
-            print(f"  > {performer.name} found something!")
-        else:
-            print(f"  > {performer.name} found nothing.")
+        logger.debug(_OUTCOME_NARRATION[was_successful], performer.name)
 
         return was_successful
\ No newline at end of file
@@ -1,8 +1,11 @@
 # File: actions/spell_actions.py
 """Spell casting actions."""
+from systems.spell_system.spell_manager import SpellManager
 
 # This is a placeholder for a real Action class
 class Action:
+    spell = None
+
     def __init__(self, name):
         self.name = name
 
@@ -20,8 +23,6 @@ class CastSpellAction(Action):
         Execute spell casting.
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
-        from systems.spell_system.spell_manager import SpellManager
-
         spell_targets = self.targets if self.targets is not None else target
 
         return SpellManager.cast_spell(
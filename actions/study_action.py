@@ -1,6 +1,13 @@
 # File: actions/study_action.py
 """Implementation of the Study action."""
+import logging
 from systems.d20_system import perform_d20_test
+from actions._skill_tables import canonical_skill
+
+logger = logging.getLogger('dnd.actions')
+
+# Narration templates indexed by the check result (False, True)
+_OUTCOME_NARRATION = ("  > %s cannot recall anything useful.", "  > %s recalls a key piece of information!")
 
 class StudyAction:
     """Represents the Study action, which uses various Intelligence skills."""
@@ -17,13 +24,10 @@ class StudyAction:
         was_successful = perform_d20_test(
             creature=performer,
             ability_name='int',
-            check_type=skill_to_use.lower(), # e.g., 'history'
+            check_type=canonical_skill(skill_to_use), # e.g., 'history'
             dc=dc_to_beat
         )
         
-        if was_successful:
-            print(f"  > {performer.name} recalls a key piece of information!")
-        else:
-            print(f"  > {performer.name} cannot recall anything useful.")
+        logger.debug(_OUTCOME_NARRATION[was_successful], performer.name)
 
         return was_successful
\ No newline at end of file
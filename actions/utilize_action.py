@@ -1,5 +1,8 @@
 # File: actions/utilize_action.py
 """Implementation of the Utilize action."""
+import logging
+
+logger = logging.getLogger('dnd.actions')
 
 class UtilizeAction:
     """Represents the Utilize action for using an object."""
@@ -12,7 +15,7 @@ class UtilizeAction:
         The outcome would depend on the object being used.
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
-        print(f"  > {performer.name} uses their action to interact with '{object_name}'.")
+        logger.debug("  > %s uses their action to interact with '%s'.", performer.name, object_name)
         # In a full game, this is where you would trigger the object's specific effect,
         # such as pulling a lever, drinking a potion, etc.
         return True
\ No newline at end of file
@@ -1,67 +1,169 @@
 # File: core/utils.py
 """ Core utility functions, including the global dice rolling system. """
+import functools
 import random
 import re
-import math
+import sys
+from random import randint as _randint
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; dice fall back to the random module
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batched rolls fall back to a loop
+    np = None
+
+_rng = np.random.default_rng() if np is not None else None
+
+# Lenient prefix match for dice notation like "1d20+5" or "8d6"; well-formed
+# notation is handled by _split_dice_notation without the regex engine
+_DICE_RE = re.compile(r'(\d+)d(\d+)([+-]\d+)?')
 
 def get_ability_modifier(score):
     """Calculates the ability modifier for a given score."""
     return (score - 10) // 2
 
+def _sum_dice(num_dice, die_type):
+    """Rolls num_dice dice with die_type sides and returns the sum."""
+    total = 0
+    for _ in range(num_dice):
+        total += _randint(1, die_type)
+    return total
+
+if njit is not None:
+    # Compiled eagerly for the one signature we use; numba keeps its own RNG
+    # state, so only seed_dice() (not random.seed()) makes this path repeatable.
+    _sum_dice = njit('int64(int64, int64)', cache=True, nogil=True)(_sum_dice)
+
+    @njit('void(int64)', cache=True)
+    def _seed_numba(seed):
+        """Seeds the RNG shared by all numba-compiled dice loops."""
+        random.seed(seed)
+
+# Without numba, large pools (8d6 Fireball, hit-point rolls) are cheaper as one
+# numpy draw; below this size a single numpy call costs more than the loop.
+_NUMPY_MIN_DICE = 8
+_use_numpy_sums = njit is None and _rng is not None
+
 def roll_dice(dice_notation):
     """
     Rolls dice based on standard D&D notation (e.g., '3d8+5', '1d20-1').
     This function is based on the rules provided in the 2024 Player's Handbook.
     """
-    # Regex to parse dice notation like "1d20+5" or "8d6"
-    match = re.match(r'(\d+)d(\d+)([+-]\d+)?', dice_notation.lower().strip())
-    
-    if not match:
-        raise ValueError(f"Invalid dice notation: '{dice_notation}'")
-
-    num_dice = int(match.group(1))
-    die_type = int(match.group(2))
-    modifier_str = match.group(3)
-
-    modifier = int(modifier_str) if modifier_str else 0
-
-    # Roll the specified number of dice and sum the results
-    total = sum(random.randint(1, die_type) for _ in range(num_dice))
-
-    return total + modifier
+    # Notation built at runtime (f-strings, JSON) is interned so repeat lookups in
+    # the parse cache compare keys by identity rather than character by character
+    num_dice, die_type, modifier = parse_dice_notation(sys.intern(dice_notation))
+    return roll_parsed_dice(num_dice, die_type, modifier)
+
+def roll_parsed_dice(num_dice, die_type, modifier=0):
+    """Rolls dice already split into (num_dice, die_type, modifier), e.g. by parse_dice_notation."""
+    if num_dice == 1:
+        rolls = _SINGLE_DIE_ROLLS.get(die_type)
+        if rolls is not None:
+            return next(rolls) + modifier
+    if _use_numpy_sums and num_dice >= _NUMPY_MIN_DICE:
+        return int(_rng.integers(1, die_type + 1, size=num_dice, dtype=np.int32).sum()) + modifier
+    return _sum_dice(num_dice, die_type) + modifier
+
+def roll_dice_batch(count, num_dice, die_type):
+    """
+    Rolls `count` independent sets of `num_dice` dice with `die_type` sides.
+    Returns a list with the sum of each set, for scenes that need the same
+    damage dice rolled once per target or per hit.
+    """
+    if _rng is not None:
+        return _rng.integers(1, die_type + 1, size=(count, num_dice), dtype=np.int32).sum(axis=1).tolist()
+    return [_sum_dice(num_dice, die_type) for _ in range(count)]
+
+# Single-die helpers draw from per-die buffers refilled _ROLL_BATCH_SIZE rolls at a
+# time, turning one RNG call per roll into one per batch. Rolls already buffered
+# are not affected by a later random.seed() (use seed_dice()), and the buffers
+# are not thread-safe.
+_ROLL_BATCH_SIZE = 1024
+
+def _buffered_rolls(die_type):
+    """Endless stream of single rolls of a die_type-sided die."""
+    faces = range(1, die_type + 1)
+    while True:
+        if _rng is not None:
+            yield from _rng.integers(1, die_type + 1, size=_ROLL_BATCH_SIZE, dtype=np.int32).tolist()
+        else:
+            yield from random.choices(faces, k=_ROLL_BATCH_SIZE)
+
+# Single-die rolls of a standard die ("1d10", "1d8+3") draw from the buffers too
+_SINGLE_DIE_ROLLS = {}
+
+def _reset_roll_buffers():
+    """Starts fresh, empty roll streams for every buffered die."""
+    global _d3_rolls, _d4_rolls, _d6_rolls, _d8_rolls, _d10_rolls, _d12_rolls, _d20_rolls, _d100_rolls
+    _d3_rolls = _buffered_rolls(3)
+    _d4_rolls = _buffered_rolls(4)
+    _d6_rolls = _buffered_rolls(6)
+    _d8_rolls = _buffered_rolls(8)
+    _d10_rolls = _buffered_rolls(10)
+    _d12_rolls = _buffered_rolls(12)
+    _d20_rolls = _buffered_rolls(20)
+    _d100_rolls = _buffered_rolls(100)
+    _SINGLE_DIE_ROLLS.update({
+        3: _d3_rolls, 4: _d4_rolls, 6: _d6_rolls, 8: _d8_rolls,
+        10: _d10_rolls, 12: _d12_rolls, 20: _d20_rolls, 100: _d100_rolls,
+    })
+
+_reset_roll_buffers()
+
+def seed_dice(seed):
+    """
+    Seeds every dice source - the random module, the shared numpy generator and
+    numba's RNG - and discards buffered rolls, so a run can be replayed exactly.
+    """
+    random.seed(seed)
+    if _rng is not None:
+        _rng.bit_generator.state = type(_rng.bit_generator)(seed).state
+    if njit is not None:
+        _seed_numba(seed)
+    _reset_roll_buffers()
+
+def get_rng():
+    """
+    Returns the shared numpy Generator behind the batched rolls, or None without
+    numpy. seed_dice reseeds it in place, so callers may keep the reference.
+    """
+    return _rng
 
 def roll_d20():
     """Rolls a single 20-sided die."""
-    return random.randint(1, 20)
+    return next(_d20_rolls)
 
 def roll_d100():
     """Rolls percentile dice (d100)."""
-    return random.randint(1, 100)
+    return next(_d100_rolls)
 
 def roll_d3():
-    """Simulates rolling a d3 by rolling a d6 and dividing by 2, rounded up."""
-    # As per PHB rules for simulating dice 
-    return math.ceil(random.randint(1, 6) / 2)
+    """Rolls a single 3-sided die."""
+    return next(_d3_rolls)
 
 def roll_d4():
     """Rolls a single 4-sided die."""
-    return random.randint(1, 4)
+    return next(_d4_rolls)
 
 def roll_d6():
     """Rolls a single 6-sided die."""
-    return random.randint(1, 6)
+    return next(_d6_rolls)
 
 def roll_d8():
     """Rolls a single 8-sided die."""
-    return random.randint(1, 8)
+    return next(_d8_rolls)
 
 def roll_d10():
     """Rolls a single 10-sided die."""
-    return random.randint(1, 10)
+    return next(_d10_rolls)
 
 def roll_d12():
     """Rolls a single 12-sided die."""
-    return random.randint(1, 12)
+    return next(_d12_rolls)
 
 # --- CONVENIENCE FUNCTIONS ---
 def roll_advantage():
@@ -74,36 +176,62 @@ def roll_disadvantage():
     roll1, roll2 = roll_d20(), roll_d20()
     return min(roll1, roll2), (roll1, roll2)
 
+# Hit die size by class
+_HIT_DICE = {
+    'barbarian': 12,
+    'fighter': 10,
+    'paladin': 10,
+    'ranger': 10,
+    'bard': 8,
+    'cleric': 8,
+    'druid': 8,
+    'monk': 8,
+    'rogue': 8,
+    'warlock': 8,
+    'artificer': 8,
+    'sorcerer': 6,
+    'wizard': 6
+}
+
 def roll_hit_die(class_name):
     """Rolls the appropriate hit die for a class."""
-    hit_dice = {
-        'barbarian': 12,
-        'fighter': 10,
-        'paladin': 10,
-        'ranger': 10,
-        'bard': 8,
-        'cleric': 8,
-        'druid': 8,
-        'monk': 8,
-        'rogue': 8,
-        'warlock': 8,
-        'artificer': 8,
-        'sorcerer': 6,
-        'wizard': 6
-    }
-    
-    die_size = hit_dice.get(class_name.lower(), 8)  # Default to d8
-    return random.randint(1, die_size)
+    die_size = _HIT_DICE.get(class_name.lower(), 8)  # Default to d8
+    return _randint(1, die_size)
 
 # --- VALIDATION FUNCTIONS ---
 def is_valid_dice_notation(dice_string):
     """Checks if a string is valid dice notation."""
-    pattern = r'^\d+d\d+([+-]\d+)?$'
-    return bool(re.match(pattern, dice_string.lower().strip()))
+    return _split_dice_notation(dice_string.lower().strip()) is not None
 
+def _split_dice_notation(notation):
+    """
+    Splits exact 'NdS', 'NdS+M' or 'NdS-M' notation into (num_dice, die_type, modifier).
+    Returns None for anything else.
+    """
+    num_dice, d, rest = notation.partition('d')
+    if not d or not num_dice.isdecimal():
+        return None
+    for sign in '+-':
+        die_type, found, modifier = rest.partition(sign)
+        if found:
+            if die_type.isdecimal() and modifier.isdecimal():
+                return int(num_dice), int(die_type), int(modifier) if sign == '+' else -int(modifier)
+            return None
+    if rest.isdecimal():
+        return int(num_dice), int(rest), 0
+    return None
+
+# Games reuse a handful of notations ("1d20", "1d10+3", "8d6"), so parses are memoized
+@functools.lru_cache(maxsize=256)
 def parse_dice_notation(dice_notation):
     """Parses dice notation and returns (num_dice, die_type, modifier)."""
-    match = re.match(r'(\d+)d(\d+)([+-]\d+)?', dice_notation.lower().strip())
+    notation = dice_notation.lower().strip()
+    parsed = _split_dice_notation(notation)
+    if parsed is not None:
+        return parsed
+    
+    # Fall back to the lenient prefix match (e.g. "1d6 fire" -> 1d6)
+    match = _DICE_RE.match(notation)
     
     if not match:
         raise ValueError(f"Invalid dice notation: '{dice_notation}'")
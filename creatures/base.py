@@ -1,10 +1,38 @@
 # File: creatures/base.py
 """Base class for all creatures in the game."""
+import logging
+import math
+from types import MappingProxyType
 from core.utils import get_ability_modifier
+from systems.action_economy import ActionEconomyManager
+
+logger = logging.getLogger('dnd.creatures')
+
+# Ability scores and modifiers are stored as tuples in this order; ABILITY_INDEX maps names to positions
+ABILITIES = ('str', 'dex', 'con', 'int', 'wis', 'cha')
+ABILITY_INDEX = {ability: index for index, ability in enumerate(ABILITIES)}
 
 class Creature:
     """A base representation of a creature."""
     
+    # Core combat state lives in fixed slots, as does the optional state other systems
+    # attach later; those slots stay unset (hasattr() is False) until assigned.
+    # Instances have no __dict__, so any new per-creature attribute needs a slot here.
+    __slots__ = (
+        'name', 'level', 'ac', 'max_hp', 'current_hp', 'speed', 'ability_scores', 'ability_modifiers', 'cr',
+        'is_alive', 'conditions', 'proficiencies', 'is_dodging', 'is_disengaging',
+        'help_attack_target', 'help_skill', 'movement_for_turn',
+        'readied_trigger', 'readied_action_obj', 'readied_target',
+        'attitude', 'proficiency_bonus',
+        # SpellcastingManager.add_spellcasting
+        'spellcasting_ability', 'spell_slots', 'prepared_spells', 'concentrating_on', 'available_actions',
+        'get_spellcasting_modifier', 'get_spell_save_dc', 'get_spell_attack_bonus',
+        # damage_resistance_system
+        'damage_resistances', 'damage_immunities', 'damage_vulnerabilities',
+        # Set by fire spells on ignited targets; Large-or-smaller checks read size
+        'is_burning', 'size',
+    )
+    
     def __init__(self, name, level, ac, hp, speed, stats, cr=0, proficiencies=None, attitude='Indifferent'):
         self.name = name
         self.level = level
@@ -12,7 +40,7 @@ class Creature:
         self.max_hp = hp
         self.current_hp = hp
         self.speed = speed
-        self.stats = stats
+        self.stats = stats  # stored as ability_scores, see the stats property
         self.cr = cr
         self.is_alive = True
         self.conditions = set()
@@ -20,18 +48,17 @@ class Creature:
         self.is_dodging = False
         self.is_disengaging = False
         
-        self.help_effects = {
-            'attack_advantage_against': None,
-            'ability_check_advantage_on': None
-        }
+        # Help action effects: the enemy an ally will have advantage against,
+        # and the skill an ally will have advantage on
+        self.help_attack_target = None
+        self.help_skill = None
         
         self.movement_for_turn = speed
         
-        self.readied_action = {
-            'trigger': None,
-            'action': None,
-            'target': None
-        }
+        # Readied action (trigger description, action instance, target)
+        self.readied_trigger = None
+        self.readied_action_obj = None
+        self.readied_target = None
         
         # Social attitude for influence checks
         self.attitude = attitude
@@ -43,66 +70,97 @@ class Creature:
         # Reset temporary combat states
         self.is_dodging = False
         self.is_disengaging = False
-        self.readied_action = {'trigger': None, 'action': None, 'target': None}
+        self.clear_readied_action()
         
         # Use the action economy system to manage turn start
-        from systems.action_economy import ActionEconomyManager
         economy = ActionEconomyManager.start_turn(self)
         
-        print(f"\n--- {self.name}'s Turn Begins ---")
+        logger.debug("\n--- %s's Turn Begins ---", self.name)
         return economy
 
+    def clear_readied_action(self):
+        """Forget any readied action."""
+        self.readied_trigger = None
+        self.readied_action_obj = None
+        self.readied_target = None
+
     def can_take_action(self, action_type="action"):
         """Check if this creature can take a specific type of action."""
-        from systems.action_economy import ActionEconomyManager
         return ActionEconomyManager.can_take_action(self, action_type)
 
     def use_action(self, action_name, action_type="action"):
         """Use an action, tracking it in the action economy system."""
-        from systems.action_economy import ActionEconomyManager
         return ActionEconomyManager.use_action(self, action_name, action_type)
 
     def move(self, distance, movement_type="move"):
         """Move a certain distance, tracking it in the action economy system."""
-        from systems.action_economy import ActionEconomyManager
         return ActionEconomyManager.use_movement(self, distance, movement_type)
 
     def get_action_economy_status(self):
         """Get the current action economy status."""
-        from systems.action_economy import ActionEconomyManager
         economy = ActionEconomyManager.get_economy(self)
         return economy.get_status()
 
     def print_action_economy(self):
         """Print the current action economy status."""
-        from systems.action_economy import ActionEconomyManager
         economy = ActionEconomyManager.get_economy(self)
         economy.print_status()
 
     def _get_proficiency_bonus_from_level(self, level):
         """Calculates proficiency bonus from level or CR."""
-        if level <= 4: return 2
-        elif level <= 8: return 3
-        elif level <= 12: return 4
-        elif level <= 16: return 5
-        elif level <= 20: return 6
-        return 7
+        if level > 20:
+            return 7
+        # +2 through level 4, then +1 per further 4 levels; fractional CRs round up
+        return max(0, math.ceil(level) - 1) // 4 + 2
+
+    @property
+    def stats(self):
+        """
+        Read-only snapshot of the ability scores as a {'str': ..., 'cha': ...} mapping,
+        built on access. Writing into it raises TypeError; use set_stat or assign
+        `stats` so the cached modifiers stay in step.
+        """
+        return MappingProxyType(dict(zip(ABILITIES, self.ability_scores)))
+
+    @stats.setter
+    def stats(self, stats):
+        # Missing abilities default to 10, matching the old stats.get(ability, 10)
+        self.ability_scores = tuple(stats.get(ability, 10) for ability in ABILITIES)
+        # Modifiers are read on every attack, damage roll and check, so work them out once
+        self.ability_modifiers = tuple(get_ability_modifier(score) for score in self.ability_scores)
+
+    def set_stat(self, ability, score):
+        """
+        Changes one ability score and its cached modifier. The mapping returned by
+        `stats` is read-only; use this or set `stats`.
+        """
+        index = ABILITY_INDEX[ability.lower()]
+        scores = list(self.ability_scores)
+        scores[index] = score
+        modifiers = list(self.ability_modifiers)
+        modifiers[index] = get_ability_modifier(score)
+        self.ability_scores = tuple(scores)
+        self.ability_modifiers = tuple(modifiers)
 
     def get_ability_modifier(self, ability):
         """Gets the modifier for a given ability score."""
-        return get_ability_modifier(self.stats.get(ability.lower(), 10))
+        index = ABILITY_INDEX.get(ability)
+        if index is None:
+            index = ABILITY_INDEX.get(ability.lower())
+            if index is None:
+                return 0
+        return self.ability_modifiers[index]
 
     def take_damage(self, amount, attacker=None):
         """Reduces the creature's HP by the given amount."""
         self.current_hp -= amount
-        print(f"  > {self.name} takes {amount} damage, remaining HP: {self.current_hp}/{self.max_hp}")
+        logger.debug("  > %s takes %s damage, remaining HP: %s/%s", self.name, amount, self.current_hp, self.max_hp)
         if self.current_hp <= 0:
             self.current_hp = 0
             self.is_alive = False
-            print(f"  > {self.name} has been defeated!")
+            logger.debug("  > %s has been defeated!", self.name)
             
             # Clean up action economy when creature dies
-            from systems.action_economy import ActionEconomyManager
             ActionEconomyManager.cleanup_dead_creatures()
             
     def __str__(self):
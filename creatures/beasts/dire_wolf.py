@@ -1,10 +1,79 @@
 # File: creatures/beasts/dire_wolf.py
 """Implementation of the Dire Wolf enemy with official D&D 2024 stats."""
 from creatures.base import Creature
-from core.utils import roll_dice
-from systems.d20_system import perform_d20_test, was_last_roll_critical
+from core.utils import parse_dice_notation, roll_parsed_dice, get_rng
+from systems.d20_system import perform_d20_test
 from systems.condition_system import add_condition, has_condition
 from systems.attack_system import AttackSystem
+import logging
+import random
+
+logger = logging.getLogger('dnd.creatures')
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; bulk simulation runs as plain Python
+    njit = None
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; used for bulk simulation when numba is absent
+    np = None
+
+# Dice parsed once at import rather than on every roll
+_HIT_POINT_DICE = parse_dice_notation("3d10+6")
+_BITE_DICE = parse_dice_notation("1d10")
+
+# Sizes the bite can knock prone
+_LARGE_OR_SMALLER = frozenset({'Tiny', 'Small', 'Medium', 'Large'})
+
+
+def _simulate_bites(n_trials, target_ac, target_hp, attack_bonus, dmg_die, dmg_bonus, advantage):
+    """
+    Numeric bite loop for bulk balance testing: each trial is one bite against a
+    fresh target. Returns (hits, kills, total_damage).
+    """
+    hits = 0
+    kills = 0
+    total_damage = 0
+    for _ in range(n_trials):
+        d20 = random.randint(1, 20)
+        if advantage:
+            d20 = max(d20, random.randint(1, 20))
+        # Natural 1 always misses, natural 20 always hits
+        if d20 == 1 or (d20 != 20 and d20 + attack_bonus < target_ac):
+            continue
+        damage = random.randint(1, dmg_die) + dmg_bonus
+        if d20 == 20:
+            # Critical hit: double the dice, not the modifier
+            damage += random.randint(1, dmg_die)
+        hits += 1
+        total_damage += damage
+        if damage >= target_hp:
+            kills += 1
+    return hits, kills, total_damage
+
+def _simulate_bites_vectorized(n_trials, target_ac, target_hp, attack_bonus, dmg_die, dmg_bonus, advantage):
+    """
+    numpy version of _simulate_bites that rolls every trial at once. Takes the same
+    scalar arguments as the other backends, so callers get the same behaviour
+    whichever one is selected.
+    """
+    rng = get_rng()
+    d20 = rng.integers(1, 21, size=(n_trials, 2 if advantage else 1), dtype=np.int32).max(axis=1)
+    crits = d20 == 20
+    hits = crits | ((d20 != 1) & (d20 + attack_bonus >= target_ac))
+    damage = rng.integers(1, dmg_die + 1, size=n_trials, dtype=np.int32) + dmg_bonus
+    damage += crits * rng.integers(1, dmg_die + 1, size=n_trials, dtype=np.int32)
+    damage = np.where(hits, damage, 0)
+    kills = hits & (damage >= target_hp)
+    return int(hits.sum()), int(kills.sum()), int(damage.sum())
+
+# Prefer the compiled loop; otherwise roll the whole batch with numpy
+if njit is not None:
+    _simulate_bites = njit(cache=True, nogil=True)(_simulate_bites)
+elif np is not None:
+    _simulate_bites = _simulate_bites_vectorized
 
 class DireWolf(Creature):
     """
@@ -14,20 +83,32 @@ class DireWolf(Creature):
     CR 1 (XP 200; PB +2)
     """
 
+    __slots__ = ()
+
+    # Species traits shared by every Dire Wolf. Size is set per instance in
+    # __init__, through Creature's slot, since effects can change it.
+
+    # Special senses
+    darkvision = 60
+    passive_perception = 15
+
+    # Languages: None (represented as empty set)
+    languages = frozenset()
+
+    # Official proficiencies: Perception +5, Stealth +4
+    wolf_proficiencies = frozenset({
+        'perception',   # +5 total (Wis +1, Prof +2, +2 extra = +5)
+        'stealth',      # +4 total (Dex +2, Prof +2 = +4)
+        'bite'          # Attack proficiency
+    })
+
     def __init__(self, use_average_hp=False):
         # HP: 22 (3d10 + 6) - Roll unless specifically requested to use average
         if use_average_hp:
             hp = 22  # Use average HP for consistent encounters
         else:
-            hp = roll_dice("3d10+6")  # Roll HP as per D&D rules
-            print(f"  > {self.__class__.__name__} rolled {hp} HP (3d10+6)")
-        
-        # Official proficiencies: Perception +5, Stealth +4
-        wolf_proficiencies = {
-            'perception',   # +5 total (Wis +1, Prof +2, +2 extra = +5)
-            'stealth',      # +4 total (Dex +2, Prof +2 = +4)
-            'bite'          # Attack proficiency
-        }
+            hp = roll_parsed_dice(*_HIT_POINT_DICE)  # Roll HP as per D&D rules
+            logger.debug("  > %s rolled %s HP (3d10+6)", self.__class__.__name__, hp)
         
         super().__init__(
             name="Dire Wolf",
@@ -38,18 +119,9 @@ class DireWolf(Creature):
             # Official ability scores: STR 17, DEX 15, CON 15, INT 3, WIS 12, CHA 7
             stats={'str': 17, 'dex': 15, 'con': 15, 'int': 3, 'wis': 12, 'cha': 7},
             cr=1,
-            proficiencies=wolf_proficiencies
+            proficiencies=self.wolf_proficiencies
         )
-        
-        # Set creature size
         self.size = "Large"
-        
-        # Special senses
-        self.darkvision = 60
-        self.passive_perception = 15
-        
-        # Languages: None (represented as empty set)
-        self.languages = set()
 
     def has_pack_tactics(self, target=None, allies_in_combat=None):
         """
@@ -75,12 +147,12 @@ class DireWolf(Creature):
                         # Check if it's an ally of the dire wolf and not incapacitated
                         if (creature != self and creature != target and 
                             not has_condition(creature, 'incapacitated')):
-                            print(f"  > {self.name} gains Pack Tactics advantage ({creature.name} is within 5 feet of {target.name})!")
+                            logger.debug("  > %s gains Pack Tactics advantage (%s is within 5 feet of %s)!", self.name, creature.name, target.name)
                             return True
         
         # Simplified version: assume pack tactics unless specifically disabled
         # Remove this line when implementing full battlefield positioning
-        print(f"  > {self.name} benefits from Pack Tactics!")
+        logger.debug("  > %s benefits from Pack Tactics!", self.name)
         return True
 
     def make_bite_attack(self, target):
@@ -89,42 +161,39 @@ class DireWolf(Creature):
         Hit: 8 (1d10 + 3) Piercing damage. 
         If the target is a Large or smaller creature, it has the Prone condition.
         """
-        print(f"\n--- {self.name}'s Bite Attack ---")
+        logger.debug("\n--- %s's Bite Attack ---", self.name)
         
         if not target or not target.is_alive:
-            print(f"  > Invalid target for bite attack!")
+            logger.debug("  > Invalid target for bite attack!")
             return False
         
         # Check for Pack Tactics advantage
         has_pack_tactics = self.has_pack_tactics(target)
         
         # Make attack roll: +5 = +3 (Str) + 2 (Prof)
-        hit = perform_d20_test(
+        hit, is_crit = perform_d20_test(
             creature=self,
             ability_name='str',
             check_type='bite',  # Uses bite proficiency
             target=target,
             is_attack_roll=True,
             has_advantage=has_pack_tactics,
-            attacker_is_within_5_feet=True  # Bite is melee with 5 ft reach
+            attacker_is_within_5_feet=True,  # Bite is melee with 5 ft reach
+            return_crit=True
         )
         
         if hit:
-            # Check for critical hit
-            is_crit = was_last_roll_critical()
-            
             # Calculate damage: 8 (1d10 + 3) piercing damage
-            base_damage = roll_dice("1d10")
-            str_modifier = 3  # STR 17 = +3 modifier
+            num_dice, die_type, _ = _BITE_DICE
+            str_modifier = self.ability_modifiers[0]  # Str
             
             if is_crit:
-                # Critical hit: double the dice, not the modifier
-                crit_damage = roll_dice("1d10")
-                total_damage = base_damage + crit_damage + str_modifier
-                print(f"  > CRITICAL HIT! {total_damage} piercing damage! (1d10 + 1d10 + 3)")
+                # Critical hit: double the dice, not the modifier; both dice in one roll
+                total_damage = roll_parsed_dice(num_dice * 2, die_type, str_modifier)
+                logger.debug("  > CRITICAL HIT! %s piercing damage! (1d10 + 1d10 + %s)", total_damage, str_modifier)
             else:
-                total_damage = base_damage + str_modifier
-                print(f"  > {total_damage} piercing damage! (1d10 + 3)")
+                total_damage = roll_parsed_dice(num_dice, die_type, str_modifier)
+                logger.debug("  > %s piercing damage! (1d10 + %s)", total_damage, str_modifier)
             
             # Apply damage using the enhanced damage system if available
             if hasattr(target, 'take_damage_with_resistance'):
@@ -134,28 +203,40 @@ class DireWolf(Creature):
             
             # Special effect: Prone condition for Large or smaller creatures
             if self._target_is_large_or_smaller(target):
-                add_condition(target, 'prone')
-                print(f"  > {target.name} is knocked prone by the bite!")
+                # Prone has no duration to refresh, so an already-prone target is left alone
+                if has_condition(target, 'prone'):
+                    logger.debug("  > %s is already prone", target.name)
+                else:
+                    add_condition(target, 'prone')
+                    logger.debug("  > %s is knocked prone by the bite!", target.name)
             else:
-                print(f"  > {target.name} is too large to be knocked prone")
+                logger.debug("  > %s is too large to be knocked prone", target.name)
             
             return True
         else:
-            print(f"  > {self.name}'s bite misses {target.name}!")
+            logger.debug("  > %s's bite misses %s!", self.name, target.name)
             return False
 
+    @staticmethod
+    def simulate_bites(n_trials, target_ac, target_hp, advantage=True):
+        """
+        Monte Carlo summary of the official bite (+5 to hit, 1d10 + 3 piercing)
+        for balance testing; no narration, conditions or creature state involved.
+        Advantage defaults to on, matching the usual Pack Tactics case.
+        Returns (hits, kills, total_damage) over n_trials single bites.
+        """
+        return _simulate_bites(n_trials, target_ac, target_hp, 5, 10, 3, advantage)
+
     def _target_is_large_or_smaller(self, target):
         """Check if target is Large or smaller (for prone effect)."""
         # Default to True unless target is explicitly Huge or Gargantuan
-        target_size = getattr(target, 'size', 'Medium')
-        large_or_smaller = ['Tiny', 'Small', 'Medium', 'Large']
-        return target_size in large_or_smaller
+        return getattr(target, 'size', 'Medium') in _LARGE_OR_SMALLER
 
     def attempt_stealth_check(self, dc=15):
         """
         Make a Stealth check. Stealth +4 = Dex +2, Prof +2
         """
-        print(f"\n--- {self.name} attempts to hide (Stealth) ---")
+        logger.debug("\n--- %s attempts to hide (Stealth) ---", self.name)
         return perform_d20_test(
             creature=self,
             ability_name='dex',
@@ -167,7 +248,7 @@ class DireWolf(Creature):
         """
         Make a Perception check. Perception +5 = Wis +1, Prof +2, +2 special
         """
-        print(f"\n--- {self.name} makes a Perception check ---")
+        logger.debug("\n--- %s makes a Perception check ---", self.name)
         # Note: The +5 includes a +2 special bonus beyond normal calculation
         return perform_d20_test(
             creature=self,
@@ -176,24 +257,37 @@ class DireWolf(Creature):
             dc=dc
         )
 
+    # Stat block layout; None entries are filled from the instance on each call
+    _STATS_TEMPLATE = {
+        'name': None,
+        'size': 'Large',
+        'type': 'Beast',
+        'alignment': 'Unaligned',
+        'ac': None,
+        'hp': None,
+        'speed': None,
+        'abilities': None,
+        'skills': 'Perception +5, Stealth +4',
+        'senses': None,
+        'languages': 'None',
+        'cr': None,
+        'traits': None,
+        'actions': None
+    }
+
     def get_stats_summary(self):
         """Get a summary of the dire wolf's official stats."""
-        return {
-            'name': self.name,
-            'size': 'Large',
-            'type': 'Beast',
-            'alignment': 'Unaligned',
-            'ac': self.ac,
-            'hp': f"{self.current_hp}/{self.max_hp}",
-            'speed': f"{self.speed} ft.",
-            'abilities': self.stats,
-            'skills': 'Perception +5, Stealth +4',
-            'senses': f"Darkvision {self.darkvision} ft., Passive Perception {self.passive_perception}",
-            'languages': 'None',
-            'cr': f"{self.cr} (XP 200; PB +2)",
-            'traits': ['Pack Tactics'],
-            'actions': ['Bite (+5, 1d10+3 piercing, prone on hit)']
-        }
+        summary = self._STATS_TEMPLATE.copy()
+        summary['name'] = self.name
+        summary['ac'] = self.ac
+        summary['hp'] = f"{self.current_hp}/{self.max_hp}"
+        summary['speed'] = f"{self.speed} ft."
+        summary['abilities'] = self.stats
+        summary['senses'] = f"Darkvision {self.darkvision} ft., Passive Perception {self.passive_perception}"
+        summary['cr'] = f"{self.cr} (XP 200; PB +2)"
+        summary['traits'] = ['Pack Tactics']
+        summary['actions'] = ['Bite (+5, 1d10+3 piercing, prone on hit)']
+        return summary
 
     def __str__(self):
         """Enhanced string representation with official stats."""
@@ -215,11 +309,11 @@ class DireWolfBiteAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         if not target:
-            print(f"  > {performer.name} needs a target to bite!")
+            logger.debug("  > %s needs a target to bite!", performer.name)
             return False
         
         if not isinstance(performer, DireWolf):
-            print(f"  > ERROR: {performer.name} is not a Dire Wolf!")
+            logger.error("  > ERROR: %s is not a Dire Wolf!", performer.name)
             return False
         
         return performer.make_bite_attack(target)
@@ -238,7 +332,7 @@ class DireWolfStealthAction:
         NOTE: Action economy is handled by ActionExecutionSystem, not here.
         """
         if not isinstance(performer, DireWolf):
-            print(f"  > ERROR: {performer.name} is not a Dire Wolf!")
+            logger.error("  > ERROR: %s is not a Dire Wolf!", performer.name)
             return False
         
         dc = kwargs.get('dc', self.dc)
@@ -320,4 +414,6 @@ def dire_wolf_tactical_example():
 
 
 if __name__ == "__main__":
+    from error_handling import configure_logging
+    configure_logging()
     dire_wolf_tactical_example()
\ No newline at end of file
@@ -2,9 +2,9 @@
 """Error handling and logging system for the D&D system."""
 
 from .error_handler import DnDError, SpellcastingError, CombatError, ActionError, DnDErrorHandler
-from .logging_setup import setup_dnd_logging, get_logger, dnd_logger
+from .logging_setup import setup_dnd_logging, get_logger, configure_logging, dnd_logger
 
 __all__ = [
     'DnDError', 'SpellcastingError', 'CombatError', 'ActionError', 
-    'DnDErrorHandler', 'setup_dnd_logging', 'get_logger', 'dnd_logger'
+    'DnDErrorHandler', 'setup_dnd_logging', 'get_logger', 'configure_logging', 'dnd_logger'
 ]
\ No newline at end of file
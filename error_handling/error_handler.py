@@ -2,21 +2,45 @@
 """Enhanced error handling for D&D systems with improved robustness and features."""
 
 import logging
-import traceback
 import functools
 import time
+from collections import deque
 from typing import Optional, Any, Dict, List
-from enum import Enum
+from enum import IntEnum
 
-class ErrorSeverity(Enum):
-    """Error severity levels for better categorization."""
-    MINOR = "minor"        # Non-critical errors that don't affect gameplay
-    MODERATE = "moderate"  # Errors that affect specific features
-    MAJOR = "major"        # Errors that affect core gameplay
-    CRITICAL = "critical"  # Errors that could break the system
+try:
+    from systems.damage_resistance_system import DamageResistanceSystem
+except ImportError:  # resistance handling is optional; damage is applied as-is without it
+    DamageResistanceSystem = None
+
+logger = logging.getLogger('DnDSystem')
+
+class ErrorSeverity(IntEnum):
+    """Error severity levels for better categorization, ordered least to most severe."""
+    MINOR = 0     # Non-critical errors that don't affect gameplay
+    MODERATE = 1  # Errors that affect specific features
+    MAJOR = 2     # Errors that affect core gameplay
+    CRITICAL = 3  # Errors that could break the system
+
+    @property
+    def label(self):
+        """Lower-case name used in reports, e.g. 'minor'."""
+        return self.name.lower()
+
+# Per-severity (log level, log message prefix, user-facing prefix), indexed by ErrorSeverity
+_SEVERITY_DISPATCH = (
+    (logging.WARNING, "Minor issue", "WARNING"),
+    (logging.ERROR, "Error", "ERROR"),
+    (logging.ERROR, "MAJOR ERROR", "ERROR"),
+    (logging.CRITICAL, "CRITICAL ERROR", "CRITICAL"),
+)
 
 class DnDError(Exception):
     """Base exception for D&D system errors with enhanced features."""
+    # Slots keep the error fields out of a per-instance dict; BaseException still
+    # provides one lazily for any extra attributes callers attach
+    __slots__ = ('severity', 'context', 'recovery_suggestion', 'timestamp')
+    
     def __init__(self, message: str, severity: ErrorSeverity = ErrorSeverity.MODERATE, 
                  context: Optional[Dict] = None, recovery_suggestion: Optional[str] = None):
         super().__init__(message)
@@ -27,9 +51,11 @@ class DnDError(Exception):
 
 class SpellcastingError(DnDError):
     """Errors related to spellcasting with spell-specific context."""
+    __slots__ = ()
+    
     def __init__(self, message: str, spell_name: Optional[str] = None, 
                  caster_name: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', {})
         context.update({
             'spell_name': spell_name,
             'caster_name': caster_name,
@@ -39,9 +65,11 @@ class SpellcastingError(DnDError):
 
 class CombatError(DnDError):
     """Errors related to combat operations with combat context."""
+    __slots__ = ()
+    
     def __init__(self, message: str, attacker_name: Optional[str] = None, 
                  target_name: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', {})
         context.update({
             'attacker_name': attacker_name,
             'target_name': target_name,
@@ -51,9 +79,11 @@ class CombatError(DnDError):
 
 class ActionError(DnDError):
     """Errors related to action execution with action context."""
+    __slots__ = ()
+    
     def __init__(self, message: str, action_name: Optional[str] = None, 
                  performer_name: Optional[str] = None, **kwargs):
-        context = kwargs.get('context', {})
+        context = kwargs.pop('context', {})
         context.update({
             'action_name': action_name,
             'performer_name': performer_name,
@@ -64,9 +94,10 @@ class ActionError(DnDError):
 class ErrorMetrics:
     """Tracks error statistics for system health monitoring."""
     def __init__(self):
-        self.error_counts = {severity: 0 for severity in ErrorSeverity}
-        self.error_history = []
+        self.error_counts = [0] * len(ErrorSeverity)  # Indexed by ErrorSeverity
         self.max_history = 1000
+        # Oldest records fall off automatically once max_history is reached
+        self.error_history = deque(maxlen=self.max_history)
         
     def record_error(self, error: DnDError):
         """Record an error for metrics tracking."""
@@ -74,33 +105,60 @@ class ErrorMetrics:
         
         error_record = {
             'timestamp': error.timestamp,
-            'severity': error.severity.value,
+            'severity': error.severity.label,
             'message': str(error),
             'context': error.context
         }
         
         self.error_history.append(error_record)
-        
-        # Keep history size manageable
-        if len(self.error_history) > self.max_history:
-            self.error_history.pop(0)
     
     def get_error_summary(self) -> Dict:
         """Get summary of error statistics."""
         recent_errors = [e for e in self.error_history if time.time() - e['timestamp'] < 3600]  # Last hour
         
         return {
-            'total_errors': sum(self.error_counts.values()),
-            'errors_by_severity': {s.value: count for s, count in self.error_counts.items()},
+            'total_errors': sum(self.error_counts),
+            'errors_by_severity': {s.label: self.error_counts[s] for s in ErrorSeverity},
             'recent_errors_count': len(recent_errors),
             'most_recent_error': self.error_history[-1] if self.error_history else None
         }
 
+class ErrorContext:
+    """Context manager returned by DnDErrorHandler.create_context_manager."""
+    __slots__ = ('operation_name', 'context', 'start_time')
+    
+    def __init__(self, op_name, ctx):
+        self.operation_name = op_name
+        self.context = ctx
+        self.start_time = time.time()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            operation_time = time.time() - self.start_time
+            if isinstance(exc_val, DnDError):
+                exc_val.context.update(self.context)
+                exc_val.context['operation_duration'] = operation_time
+                DnDErrorHandler._handle_dnd_error(exc_val, self.operation_name)
+            else:
+                error = DnDError(
+                    f"Error in {self.operation_name}: {str(exc_val)}",
+                    context={**self.context, 'operation_duration': operation_time},
+                    recovery_suggestion=f"Review the {self.operation_name} operation for issues"
+                )
+                DnDErrorHandler._handle_dnd_error(error, self.operation_name)
+            return True  # Suppress the exception
+
 class DnDErrorHandler:
     """Enhanced centralized error handling for D&D systems."""
     
     _metrics = ErrorMetrics()
     _error_callbacks = []  # For custom error handling
+    _validated_creature_types = set()  # Classes whose instances passed the attribute check
+    _REQUIRED_CREATURE_ATTRS = ('is_alive', 'name', 'current_hp', 'max_hp')
+    _REQUIRED_WEAPON_KEYS = frozenset(('name', 'damage', 'ability', 'damage_type'))
     
     @staticmethod
     def safe_execute(operation_name: str, fallback_result=False, 
@@ -108,6 +166,20 @@ class DnDErrorHandler:
                     suppress_errors: bool = False, max_retries: int = 0):
         """Enhanced decorator for safe execution with retries and better error handling."""
         def decorator(func):
+            if max_retries == 0:
+                # Common case: a single attempt needs no retry loop around the call
+                @functools.wraps(func)
+                def single_attempt_wrapper(*args, **kwargs):
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception as e:
+                        error = DnDErrorHandler._as_dnd_error(e, operation_name, severity)
+                        DnDErrorHandler._handle_dnd_error(error, operation_name)
+                        if not suppress_errors and error.recovery_suggestion:
+                            print(f"  > RECOVERY SUGGESTION: {error.recovery_suggestion}")
+                        return fallback_result
+                return single_attempt_wrapper
+            
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
                 last_exception = None
@@ -121,23 +193,15 @@ class DnDErrorHandler:
                         DnDErrorHandler._handle_dnd_error(e, operation_name)
                         
                         if attempt < max_retries:
-                            logger = logging.getLogger('DnDSystem')
                             logger.warning(f"Retrying {operation_name} (attempt {attempt + 2}/{max_retries + 1})")
                             continue
                         break
                     except Exception as e:
-                        # Convert generic exceptions to DnD errors
-                        dnd_error = DnDError(
-                            f"Unexpected error in {operation_name}: {str(e)}",
-                            severity=severity,
-                            context={'operation': operation_name, 'original_error': type(e).__name__},
-                            recovery_suggestion=f"Try restarting the {operation_name} operation"
-                        )
+                        dnd_error = DnDErrorHandler._as_dnd_error(e, operation_name, severity)
                         last_exception = dnd_error
                         DnDErrorHandler._handle_dnd_error(dnd_error, operation_name)
                         
                         if attempt < max_retries:
-                            logger = logging.getLogger('DnDSystem')
                             logger.warning(f"Retrying {operation_name} after error (attempt {attempt + 2}/{max_retries + 1})")
                             continue
                         break
@@ -151,36 +215,40 @@ class DnDErrorHandler:
             return wrapper
         return decorator
 
+    @staticmethod
+    def _as_dnd_error(error: Exception, operation_name: str, severity: ErrorSeverity) -> DnDError:
+        """Return D&D errors as-is; wrap anything else in a DnDError. Call from an except block."""
+        if isinstance(error, DnDError):
+            return error
+        
+        # The handler only renders the traceback when DEBUG is enabled
+        logger.debug("Traceback for %s", operation_name, exc_info=True)
+        
+        # Convert generic exceptions to DnD errors
+        return DnDError(
+            f"Unexpected error in {operation_name}: {str(error)}",
+            severity=severity,
+            context={'operation': operation_name, 'original_error': type(error).__name__},
+            recovery_suggestion=f"Try restarting the {operation_name} operation"
+        )
+
     @staticmethod
     def _handle_dnd_error(error: DnDError, operation_name: str):
         """Internal method to handle D&D specific errors."""
-        logger = logging.getLogger('DnDSystem')
+        level, log_prefix, user_prefix = _SEVERITY_DISPATCH[error.severity]
         
         # Log based on severity
-        if error.severity == ErrorSeverity.CRITICAL:
-            logger.critical(f"CRITICAL ERROR in {operation_name}: {error}")
-        elif error.severity == ErrorSeverity.MAJOR:
-            logger.error(f"MAJOR ERROR in {operation_name}: {error}")
-        elif error.severity == ErrorSeverity.MODERATE:
-            logger.error(f"Error in {operation_name}: {error}")
-        else:
-            logger.warning(f"Minor issue in {operation_name}: {error}")
+        logger.log(level, "%s in %s: %s", log_prefix, operation_name, error)
         
         # Add context to log if available
         if error.context:
-            logger.debug(f"Error context: {error.context}")
+            logger.debug("Error context: %s", error.context)
         
         # Record metrics
         DnDErrorHandler._metrics.record_error(error)
         
         # User-friendly message
-        severity_prefix = {
-            ErrorSeverity.CRITICAL: "CRITICAL",
-            ErrorSeverity.MAJOR: "ERROR",
-            ErrorSeverity.MODERATE: "ERROR",
-            ErrorSeverity.MINOR: "WARNING"
-        }
-        print(f"  > {severity_prefix[error.severity]}: {operation_name} - {str(error)}")
+        print(f"  > {user_prefix}: {operation_name} - {str(error)}")
         
         # Call any registered error callbacks
         for callback in DnDErrorHandler._error_callbacks:
@@ -200,14 +268,27 @@ class DnDErrorHandler:
                 recovery_suggestion="Ensure a valid creature object is passed to the operation"
             )
         
-        # Check for required attributes with specific error messages
-        required_attrs = ['is_alive', 'name', 'current_hp', 'max_hp']
-        missing_attrs = []
-        
-        for attr in required_attrs:
-            if not hasattr(creature, attr):
-                missing_attrs.append(attr)
+        # Check for required attributes with specific error messages; once one
+        # instance of a class has them all, later instances skip the scan
+        creature_type = type(creature)
+        if creature_type not in DnDErrorHandler._validated_creature_types:
+            DnDErrorHandler._require_creature_attrs(creature, operation)
+            DnDErrorHandler._validated_creature_types.add(creature_type)
         
+        try:
+            DnDErrorHandler._validate_creature_hp(creature)
+        except AttributeError:
+            # This instance lacks an attribute others of its class had; report it
+            # the same way as the full scan
+            DnDErrorHandler._require_creature_attrs(creature, operation)
+            raise
+        return True
+
+    @staticmethod
+    def _require_creature_attrs(creature, operation):
+        """Raise DnDError naming any required creature attributes that are missing."""
+        missing_attrs = [attr for attr in DnDErrorHandler._REQUIRED_CREATURE_ATTRS
+                         if not hasattr(creature, attr)]
         if missing_attrs:
             raise DnDError(
                 f"Creature {getattr(creature, 'name', 'Unknown')} missing required attributes: {missing_attrs}",
@@ -219,27 +300,31 @@ class DnDErrorHandler:
                 },
                 recovery_suggestion="Ensure the creature object is properly initialized with all required attributes"
             )
+
+    @staticmethod
+    def _validate_creature_hp(creature):
+        """Validate creature state: negative HP is an error, HP above maximum a warning."""
+        current_hp = creature.current_hp
+        if current_hp < 0:
+            raise DnDError(
+                f"Creature {creature.name} has negative HP ({current_hp})",
+                severity=ErrorSeverity.MODERATE,
+                context={
+                    'creature_name': creature.name,
+                    'current_hp': current_hp,
+                    'max_hp': creature.max_hp
+                },
+                recovery_suggestion="Reset creature HP to 0 or restore to valid value"
+            )
         
-        # Validate creature state
-        if hasattr(creature, 'current_hp') and hasattr(creature, 'max_hp'):
-            if creature.current_hp < 0:
-                raise DnDError(
-                    f"Creature {creature.name} has negative HP ({creature.current_hp})",
-                    severity=ErrorSeverity.MODERATE,
-                    context={
-                        'creature_name': creature.name,
-                        'current_hp': creature.current_hp,
-                        'max_hp': creature.max_hp
-                    },
-                    recovery_suggestion="Reset creature HP to 0 or restore to valid value"
-                )
-            
-            if creature.current_hp > creature.max_hp:
-                # This is usually not an error, but worth logging
-                logger = logging.getLogger('DnDSystem')
-                logger.warning(f"{creature.name} has HP ({creature.current_hp}) above maximum ({creature.max_hp})")
-        
-        return True
+        if current_hp > creature.max_hp:
+            # This is usually not an error, but worth logging
+            logger.warning("%s has HP (%s) above maximum (%s)", creature.name, current_hp, creature.max_hp)
+
+    @staticmethod
+    def clear_validation_cache():
+        """Forget which creature classes have passed validation (e.g. after patching a class)."""
+        DnDErrorHandler._validated_creature_types.clear()
 
     @staticmethod
     def validate_spell_components(caster, spell, spell_level):
@@ -318,9 +403,11 @@ class DnDErrorHandler:
             )
         
         if weapon_data:
-            required_keys = ['name', 'damage', 'ability', 'damage_type']
-            missing_keys = [key for key in required_keys if key not in weapon_data]
+            # Dicts iterate their keys; WeaponData tuples list theirs in _fields
+            missing_keys = DnDErrorHandler._REQUIRED_WEAPON_KEYS.difference(
+                getattr(weapon_data, '_fields', weapon_data))
             if missing_keys:
+                missing_keys = sorted(missing_keys)
                 raise CombatError(
                     f"Weapon data missing keys: {missing_keys}",
                     attacker_name=attacker.name,
@@ -339,13 +426,11 @@ class DnDErrorHandler:
             DnDErrorHandler.validate_creature(target, "damage application")
         except DnDError as e:
             # Don't re-raise, just log and return - damage application should be permissive
-            logger = logging.getLogger('DnDSystem')
             logger.warning(f"Damage application to invalid target: {e}")
             return
         
         # Validate damage amount
         if damage < 0:
-            logger = logging.getLogger('DnDSystem')
             logger.warning(f"Negative damage ({damage}) converted to 0")
             damage = 0
         
@@ -355,17 +440,18 @@ class DnDErrorHandler:
         
         # Apply damage using the most appropriate method available
         try:
-            if hasattr(target, 'take_damage_with_resistance'):
-                target.take_damage_with_resistance(damage, damage_type, source)
+            # Looked up on the target itself, so a method set on one creature is used too;
+            # the resistances it applies are read from the creature on every hit
+            take_damage_with_resistance = getattr(target, 'take_damage_with_resistance', None)
+            if take_damage_with_resistance is not None:
+                take_damage_with_resistance(damage, damage_type, source)
+            elif DamageResistanceSystem is not None:
+                # Use the global damage resistance system
+                final_damage = DamageResistanceSystem.calculate_damage(target, damage, damage_type, source)
+                target.take_damage(final_damage, source)
             else:
-                # Try global damage resistance system
-                try:
-                    from systems.damage_resistance_system import DamageResistanceSystem
-                    final_damage = DamageResistanceSystem.calculate_damage(target, damage, damage_type, source)
-                    target.take_damage(final_damage, source)
-                except ImportError:
-                    # Fallback to basic damage
-                    target.take_damage(damage, source)
+                # Fallback to basic damage
+                target.take_damage(damage, source)
         except Exception as e:
             # Create a detailed error for damage application failure
             damage_error = DnDError(
@@ -399,29 +485,4 @@ class DnDErrorHandler:
     @staticmethod
     def create_context_manager(operation_name: str, **context):
         """Create a context manager for error handling with automatic context."""
-        class ErrorContext:
-            def __init__(self, op_name, ctx):
-                self.operation_name = op_name
-                self.context = ctx
-                self.start_time = time.time()
-            
-            def __enter__(self):
-                return self
-            
-            def __exit__(self, exc_type, exc_val, exc_tb):
-                if exc_type:
-                    operation_time = time.time() - self.start_time
-                    if isinstance(exc_val, DnDError):
-                        exc_val.context.update(self.context)
-                        exc_val.context['operation_duration'] = operation_time
-                        DnDErrorHandler._handle_dnd_error(exc_val, self.operation_name)
-                    else:
-                        error = DnDError(
-                            f"Error in {self.operation_name}: {str(exc_val)}",
-                            context={**self.context, 'operation_duration': operation_time},
-                            recovery_suggestion=f"Review the {self.operation_name} operation for issues"
-                        )
-                        DnDErrorHandler._handle_dnd_error(error, self.operation_name)
-                    return True  # Suppress the exception
-        
         return ErrorContext(operation_name, context)
\ No newline at end of file
@@ -6,12 +6,30 @@ import logging.handlers
 import os
 import json
 import sys
+import time
+import atexit
+import copy
+import queue
 import functools
+import operator
 from datetime import datetime
+from time import perf_counter_ns
 from pathlib import Path
 from typing import Dict, Optional, Any
 import threading
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON logs fall back to the json module
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(obj):
+        """Serialize obj to a JSON string with orjson (non-string dict keys allowed, as with json)."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _json_dumps = json.dumps
+
 class ColoredFormatter(logging.Formatter):
     """Colored formatter for console output to improve readability."""
     
@@ -25,19 +43,68 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = '\033[0m'
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._colored = {level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()}
+    
     def format(self, record):
-        # Add color to the log level name
-        if record.levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[record.levelname]}{record.levelname}{self.RESET}"
-        
-        return super().format(record)
+        # Color the level name only while this formatter runs; the record is
+        # shared with the file and JSON handlers, which must see it unchanged
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
+
+class CachingFormatter(logging.Formatter):
+    """Formatter that reuses its output when several handlers share it for one record."""
+    
+    def format(self, record):
+        cached = record.__dict__.get('_formatted')
+        if cached is not None and cached[0] == id(self):
+            return cached[1]
+        formatted = super().format(record)
+        record._formatted = (id(self), formatted)
+        return formatted
+
+_MISSING = object()
+
+# logging's own module path; while set, every record walks the stack to find its caller
+_LOGGING_SRCFILE = logging._srcfile
+_CALLER_FIELDS = ('%(pathname)', '%(filename)', '%(module)', '%(funcName)', '%(lineno)')
 
 class JSONFormatter(logging.Formatter):
-    """JSON formatter for structured logging - useful for log analysis tools."""
+    """
+    JSON formatter for structured logging - useful for log analysis tools.
+    
+    The module/function/line fields need caller lookup. With LogManager's
+    'trim_record_fields' option on, that stays enabled only while JSON output is
+    configured; otherwise they read "(unknown file)", None and 0.
+    """
+    
+    # Context attributes copied into the entry when a record carries them
+    EXTRA_FIELDS = ('creature_name', 'spell_name', 'combat_round')
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Records arrive in bursts, so the date/time part is cached per second
+        self._cached_second = None
+        self._cached_time = ''
+    
+    def _format_timestamp(self, created):
+        """Local ISO 8601 timestamp with microseconds, e.g. 2025-01-01T12:00:00.000123."""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_second = second
+            self._cached_time = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+        # Rounded like datetime.fromtimestamp, but kept within the same second
+        microseconds = min(round((created - second) * 1e6), 999999)
+        return f"{self._cached_time}.{microseconds:06d}"
     
     def format(self, record):
         log_entry = {
-            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'timestamp': self._format_timestamp(record.created),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
@@ -51,63 +118,117 @@ class JSONFormatter(logging.Formatter):
             log_entry['exception'] = self.formatException(record.exc_info)
         
         # Add any extra fields
-        if hasattr(record, 'creature_name'):
-            log_entry['creature_name'] = record.creature_name
-        if hasattr(record, 'spell_name'):
-            log_entry['spell_name'] = record.spell_name
-        if hasattr(record, 'combat_round'):
-            log_entry['combat_round'] = record.combat_round
+        for field in self.EXTRA_FIELDS:
+            value = getattr(record, field, _MISSING)
+            if value is not _MISSING:
+                log_entry[field] = value
         
-        return json.dumps(log_entry)
+        return _json_dumps(log_entry)
 
 class ContextFilter(logging.Filter):
     """Filter to add context information to log records."""
     
+    # Older context names and the record attributes they fill
+    _CONTEXT_ALIASES = {'current_creature': 'creature_name', 'current_spell': 'spell_name'}
+    # Attributes logging sets on every record; context keys with these names are
+    # stored as 'context_<key>' so they can't replace the record's own fields
+    _RESERVED_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {'message', 'asctime', '_formatted'}
+    _RENAMED_KEYS = _RESERVED_ATTRS | _CONTEXT_ALIASES.keys()
+    
     def __init__(self):
         super().__init__()
         self.context = threading.local()
     
     def filter(self, record):
-        # Add context information if available
-        if hasattr(self.context, 'current_creature'):
-            record.creature_name = self.context.current_creature
-        if hasattr(self.context, 'current_spell'):
-            record.spell_name = self.context.current_spell
-        if hasattr(self.context, 'combat_round'):
-            record.combat_round = self.context.combat_round
+        # Copy every context value onto the record in one step
+        context = self.context.__dict__
+        if context:
+            record.__dict__.update(context)
         
         return True
     
     def set_context(self, **kwargs):
         """Set context information for subsequent log messages."""
-        for key, value in kwargs.items():
-            setattr(self.context, key, value)
+        context = self.context.__dict__
+        if self._RENAMED_KEYS.isdisjoint(kwargs):
+            context.update(kwargs)
+        else:
+            aliases = self._CONTEXT_ALIASES
+            reserved = self._RESERVED_ATTRS
+            for key, value in kwargs.items():
+                if key in reserved:
+                    key = f'context_{key}'
+                context[aliases.get(key, key)] = value
     
     def clear_context(self):
-        """Clear all context information."""
-        self.context = threading.local()
+        """Clear all context information for the current thread."""
+        self.context.__dict__.clear()
+
+class BatchedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that checks the file size every `check_every` records
+    instead of on every record, trading a slight overshoot of maxBytes for
+    fewer seek/tell calls.
+    """
+    
+    def __init__(self, *args, check_every=64, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.check_every = check_every
+        self._records_since_check = 0
+    
+    def shouldRollover(self, record):
+        self._records_since_check += 1
+        if self._records_since_check < self.check_every:
+            return False
+        self._records_since_check = 0
+        return super().shouldRollover(record)
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener's handlers.
+    
+    The stock prepare() formats the record and drops exc_info, so a JSON
+    handler behind the queue would lose its exception field. Here only the
+    message is merged with its args, so later changes to them don't show up.
+    """
+    
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
 class PerformanceLogger:
     """Logger for tracking performance metrics."""
     
     def __init__(self, logger_name='Performance'):
         self.logger = logging.getLogger(logger_name)
-        self.operation_times = {}
+        # (operation_name, start_ns) pairs; timed operations are normally nested
+        self.operation_times = []
     
     def start_operation(self, operation_name: str):
         """Start timing an operation."""
-        import time
-        self.operation_times[operation_name] = time.time()
+        self.operation_times.append((operation_name, perf_counter_ns()))
     
     def end_operation(self, operation_name: str, log_level=logging.INFO):
         """End timing an operation and log the duration."""
-        import time
-        if operation_name in self.operation_times:
-            duration = time.time() - self.operation_times[operation_name]
-            self.logger.log(log_level, f"Operation '{operation_name}' took {duration:.3f} seconds")
-            del self.operation_times[operation_name]
+        start_ns = self._pop_start(operation_name)
+        if start_ns is not None:
+            duration = (perf_counter_ns() - start_ns) * 1e-9
+            self.logger.log(log_level, "Operation '%s' took %.3f seconds", operation_name, duration)
             return duration
         return None
+    
+    def _pop_start(self, operation_name: str) -> Optional[int]:
+        """Remove and return the start time of the most recent matching operation."""
+        operation_times = self.operation_times
+        if operation_times and operation_times[-1][0] == operation_name:
+            return operation_times.pop()[1]
+        # Operations ended out of order
+        for index in range(len(operation_times) - 1, -1, -1):
+            if operation_times[index][0] == operation_name:
+                return operation_times.pop(index)[1]
+        return None
 
 class LogManager:
     """Central manager for all logging configuration and setup."""
@@ -118,6 +239,13 @@ class LogManager:
         self.performance_logger = PerformanceLogger()
         self.log_directory = Path('logs')
         self.config = self._get_default_config()
+        # Drains queued records into the file handlers on a background thread
+        self._queue_listener = None
+        # (monotonic second, names) from the last log directory scan
+        self._log_files_cache = (None, [])
+        # logging's record switches as they were before trim_record_fields changed them
+        self._saved_record_fields = None
+        atexit.register(self._stop_queue_listener)
     
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default logging configuration."""
@@ -129,6 +257,8 @@ class LogManager:
             'colored_console': True,
             'max_file_size': 10 * 1024 * 1024,  # 10MB
             'backup_count': 5,
+            'file_buffer_capacity': 1024,  # Records held in memory before a file write
+            'trim_record_fields': False,  # Process-wide; see _configure_record_fields
             'log_format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             'date_format': '%Y-%m-%d %H:%M:%S'
         }
@@ -145,26 +275,41 @@ class LogManager:
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(self.config['log_level'])
+        self._configure_record_fields()
         
         # Clear any existing handlers
         root_logger.handlers.clear()
+        self._stop_queue_listener()
+        
+        # File and JSON handlers write on the listener thread, so callers only
+        # pay for putting the record on a queue
+        file_handlers = []
         
         # Set up file logging with rotation
         if self.config['file_output']:
-            self._setup_file_logging(root_logger)
-        
-        # Set up console logging
-        if self.config['console_output']:
-            self._setup_console_logging(root_logger)
+            self._setup_file_logging(file_handlers)
         
         # Set up JSON logging if requested
         if self.config['json_output']:
-            self._setup_json_logging(root_logger)
+            self._setup_json_logging(file_handlers)
+        
+        if file_handlers:
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(RecordQueueHandler(log_queue))
+            self._queue_listener = logging.handlers.QueueListener(
+                log_queue, *file_handlers, respect_handler_level=True
+            )
+            self._queue_listener.start()
+        
+        # Set up console logging; kept synchronous so it stays in order with print() output
+        if self.config['console_output']:
+            self._setup_console_logging(root_logger)
         
         # Create specialized loggers
         self._setup_specialized_loggers()
         
-        # Add context filter to all loggers
+        # Add context filter to all loggers; it reads thread-local context, so it sits
+        # on the root handlers, which run on the caller's thread
         for handler in root_logger.handlers:
             handler.addFilter(self.context_filter)
         
@@ -173,33 +318,52 @@ class LogManager:
         
         return main_logger
     
-    def _setup_file_logging(self, logger):
+    def _stop_queue_listener(self):
+        """Flush queued records to the file handlers and close them."""
+        if self._queue_listener is not None:
+            self._queue_listener.stop()
+            for handler in self._queue_listener.handlers:
+                # A MemoryHandler flushes on close but leaves its target open
+                target = getattr(handler, 'target', None)
+                handler.close()
+                if target is not None:
+                    target.close()
+            self._queue_listener = None
+    
+    def _setup_file_logging(self, handlers):
         """Set up rotating file logging."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         log_file = self.log_directory / f'dnd_system_{timestamp}.log'
         
         # Rotating file handler
-        file_handler = logging.handlers.RotatingFileHandler(
+        file_handler = BatchedRotatingFileHandler(
             log_file,
             maxBytes=self.config['max_file_size'],
             backupCount=self.config['backup_count']
         )
         file_handler.setLevel(self.config['log_level'])
         
-        # Standard formatter for files
-        file_formatter = logging.Formatter(
+        # Standard formatter for files, shared with the "latest" copy below
+        file_formatter = CachingFormatter(
             self.config['log_format'],
             datefmt=self.config['date_format']
         )
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
         
-        # Also create a "latest" symlink/copy
+        handlers.append(self._buffered(file_handler))
+        
+        # Also create a "latest" symlink to this session's file, so each record is
+        # written once. Rotation keeps the base filename, so the link stays valid.
         latest_log = self.log_directory / 'dnd_latest.log'
-        latest_handler = logging.FileHandler(latest_log, mode='w')
-        latest_handler.setLevel(self.config['log_level'])
-        latest_handler.setFormatter(file_formatter)
-        logger.addHandler(latest_handler)
+        try:
+            latest_log.unlink(missing_ok=True)
+            os.symlink(log_file.name, latest_log)
+        except OSError:
+            # No symlink support (e.g. Windows without the privilege): write a copy instead
+            latest_handler = logging.FileHandler(latest_log, mode='w')
+            latest_handler.setLevel(self.config['log_level'])
+            latest_handler.setFormatter(file_formatter)
+            handlers.append(latest_handler)
     
     def _setup_console_logging(self, logger):
         """Set up console logging with optional colors."""
@@ -220,13 +384,52 @@ class LogManager:
         console_handler.setFormatter(console_formatter)
         logger.addHandler(console_handler)
     
-    def _setup_json_logging(self, logger):
+    def _setup_json_logging(self, handlers):
         """Set up JSON structured logging."""
         json_file = self.log_directory / 'dnd_system.jsonl'
         json_handler = logging.FileHandler(json_file)
         json_handler.setLevel(self.config['log_level'])
         json_handler.setFormatter(JSONFormatter())
-        logger.addHandler(json_handler)
+        handlers.append(self._buffered(json_handler))
+    
+    def _buffered(self, target):
+        """Buffer records for target in memory and write them in batches; warnings and errors flush immediately."""
+        buffered_handler = logging.handlers.MemoryHandler(
+            self.config['file_buffer_capacity'],
+            flushLevel=logging.WARNING,
+            target=target,
+            flushOnClose=True
+        )
+        buffered_handler.setLevel(self.config['log_level'])
+        return buffered_handler
+    
+    def _configure_record_fields(self):
+        """
+        With 'trim_record_fields' on, skip per-record metadata that none of the
+        configured formatters print. The switches are global to the logging module,
+        so this affects every logger in the process, and is opt-in. Setting up
+        again without the option restores the values found before.
+        """
+        if not self.config['trim_record_fields']:
+            self._restore_record_fields()
+            return
+        if self._saved_record_fields is None:
+            self._saved_record_fields = (
+                logging.logThreads, logging.logProcesses, logging.logMultiprocessing, logging._srcfile
+            )
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+        log_format = self.config['log_format']
+        needs_caller = self.config['json_output'] or any(field in log_format for field in _CALLER_FIELDS)
+        logging._srcfile = _LOGGING_SRCFILE if needs_caller else None
+    
+    def _restore_record_fields(self):
+        """Put back the record switches _configure_record_fields changed."""
+        if self._saved_record_fields is not None:
+            (logging.logThreads, logging.logProcesses,
+             logging.logMultiprocessing, logging._srcfile) = self._saved_record_fields
+            self._saved_record_fields = None
     
     def _setup_specialized_loggers(self):
         """Set up specialized loggers for different systems."""
@@ -250,11 +453,12 @@ class LogManager:
     
     def get_logger(self, name='DnDSystem') -> logging.Logger:
         """Get a logger for a specific system."""
-        if name not in self.loggers:
+        logger = self.loggers.get(name)
+        if logger is None:
             logger = logging.getLogger(name)
             logger.setLevel(self.config['log_level'])
             self.loggers[name] = logger
-        return self.loggers[name]
+        return logger
     
     def set_context(self, **kwargs):
         """Set logging context for all subsequent log messages."""
@@ -274,23 +478,47 @@ class LogManager:
     def get_log_stats(self) -> Dict:
         """Get statistics about current logging setup."""
         root_logger = logging.getLogger()
+        # Count the handlers that write output, including those behind the queue
+        handlers_count = sum(1 for h in root_logger.handlers if not isinstance(h, logging.handlers.QueueHandler))
+        if self._queue_listener is not None:
+            handlers_count += len(self._queue_listener.handlers)
         return {
             'log_directory': str(self.log_directory),
             'log_level': logging.getLevelName(self.config['log_level']),
-            'handlers_count': len(root_logger.handlers),
+            'handlers_count': handlers_count,
             'specialized_loggers': list(self.loggers.keys()),
-            'log_files': [f.name for f in self.log_directory.glob('*.log')] if self.log_directory.exists() else []
+            'log_files': self._list_log_files()
         }
     
+    def _list_log_files(self) -> list:
+        """Names of the .log files in the log directory, rescanned at most once a second."""
+        now = int(time.monotonic())
+        scanned_at, names = self._log_files_cache
+        if scanned_at != now:
+            try:
+                with os.scandir(self.log_directory) as entries:
+                    names = [entry.name for entry in entries
+                             if entry.name.endswith('.log') and not entry.name.startswith('.')]
+            except FileNotFoundError:
+                names = []
+            self._log_files_cache = (now, names)
+        return list(names)
+    
     def emergency_log(self, message: str, details: Optional[Dict] = None):
         """Emergency logging that writes directly to file even if logging is broken."""
         try:
             emergency_file = self.log_directory / 'emergency.log'
-            with open(emergency_file, 'a') as f:
-                timestamp = datetime.now().isoformat()
-                f.write(f"[{timestamp}] EMERGENCY: {message}\n")
-                if details:
-                    f.write(f"[{timestamp}] DETAILS: {json.dumps(details)}\n")
+            timestamp = datetime.now().isoformat()
+            entry = f"[{timestamp}] EMERGENCY: {message}{os.linesep}"
+            if details:
+                entry += f"[{timestamp}] DETAILS: {_json_dumps(details)}{os.linesep}"
+            # One append-mode write keeps the entry together when several
+            # processes hit the emergency path at once
+            fd = os.open(emergency_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, entry.encode('utf-8'))
+            finally:
+                os.close(fd)
         except Exception as e:
             # Last resort - print to stderr
             print(f"EMERGENCY LOG FAILED: {message} | Error: {e}", file=sys.stderr)
@@ -308,19 +536,41 @@ def get_logger(name='DnDSystem'):
     """Get a logger for a specific system (legacy interface)."""
     return log_manager.get_logger(name)
 
+def configure_logging(level=logging.DEBUG):
+    """
+    Configure the play-by-play narration emitted under the 'dnd' logger namespace.
+    
+    Narration is logged at DEBUG, so it is silent by default and costs a single
+    level check per call. Pass logging.DEBUG to print it to stdout, or a higher
+    level (e.g. logging.WARNING) to keep batch simulations quiet.
+    """
+    narration_logger = logging.getLogger('dnd')
+    narration_logger.setLevel(level)
+    if not narration_logger.handlers:
+        narration_handler = logging.StreamHandler(sys.stdout)
+        narration_handler.setFormatter(logging.Formatter('%(message)s'))
+        narration_logger.addHandler(narration_handler)
+        narration_logger.propagate = False
+    return narration_logger
+
 # Context managers for enhanced logging
 class LoggingContext:
     """Context manager for adding context to log messages."""
     
     def __init__(self, **context):
         self.context = context
+        self._saved = None
     
     def __enter__(self):
+        # Snapshot the enclosing context so nested blocks restore it on exit
+        self._saved = dict(log_manager.context_filter.context.__dict__)
         log_manager.set_context(**self.context)
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        log_manager.clear_context()
+        context = log_manager.context_filter.context.__dict__
+        context.clear()
+        context.update(self._saved)
 
 class PerformanceContext:
     """Context manager for tracking operation performance."""
@@ -331,98 +581,131 @@ class PerformanceContext:
         self.start_time = None
     
     def __enter__(self):
-        import time
-        self.start_time = time.time()
-        self.logger.debug(f"Starting operation: {self.operation_name}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Starting operation: {self.operation_name}")
+        self.start_time = perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        import time
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration_ns = perf_counter_ns() - self.start_time
+            # Messages are only formatted when a handler will see them
             if exc_type:
-                self.logger.warning(f"Operation '{self.operation_name}' failed after {duration:.3f}s: {exc_val}")
-            else:
-                self.logger.info(f"Operation '{self.operation_name}' completed in {duration:.3f}s")
+                self.logger.warning("Operation '%s' failed after %.3fs: %s",
+                                    self.operation_name, duration_ns * 1e-9, exc_val)
+            elif self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Operation '%s' completed in %.3fs", self.operation_name, duration_ns * 1e-9)
+
+# Initialize the logging system when module is imported. Set
+# DND_AUTOSETUP_LOGGING to 0/false/no/off to skip it (no logs/ directory or
+# file handlers) and call setup_dnd_logging() later with your own configuration.
+_AUTOSETUP_OFF_VALUES = ('0', 'false', 'no', 'off')
+if os.environ.get('DND_AUTOSETUP_LOGGING', '1').strip().lower() not in _AUTOSETUP_OFF_VALUES:
+    dnd_logger = log_manager.setup_logging()
+else:
+    dnd_logger = logging.getLogger('DnDSystem')
 
-# Initialize the logging system when module is imported
-dnd_logger = log_manager.setup_logging()
+# System loggers used by the combat hooks below, resolved once
+_COMBAT_LOG = get_logger('CombatSystem')
+_ACTION_LOG = get_logger('ActionSystem')
+_SPELL_LOG = get_logger('SpellSystem')
+_DAMAGE_LOG = get_logger('DamageSystem')
+_CONDITION_LOG = get_logger('ConditionSystem')
+_get_name = operator.attrgetter('name')
 
 # Enhanced Combat System integration
 class EnhancedCombatLogging:
-    """Enhanced logging specifically for combat operations."""
+    """
+    Enhanced logging specifically for combat operations.
+    Each hook returns before building messages or context when INFO is disabled.
+    """
     
     @staticmethod
     def log_combat_start(participants, round_number=1):
         """Log the start of combat with participants."""
-        logger = get_logger('CombatSystem')
-        participant_names = [p.name for p in participants if hasattr(p, 'name')]
+        logger = _COMBAT_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        participant_names = ', '.join(_get_name(p) for p in participants if hasattr(p, 'name'))
         
         with LoggingContext(combat_round=round_number):
-            logger.info(f"Combat started with {len(participants)} participants: {', '.join(participant_names)}")
+            logger.info("Combat started with %d participants: %s", len(participants), participant_names)
     
     @staticmethod
     def log_turn_start(creature, round_number, turn_number):
         """Log the start of a creature's turn."""
-        logger = get_logger('CombatSystem')
+        logger = _COMBAT_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
         with LoggingContext(creature_name=creature.name, combat_round=round_number, turn_number=turn_number):
-            logger.info(f"Turn started: {creature.name} (Round {round_number}, Turn {turn_number})")
+            logger.info("Turn started: %s (Round %s, Turn %s)", creature.name, round_number, turn_number)
     
     @staticmethod
     def log_action_attempt(performer, action_name, target=None):
         """Log an action attempt."""
-        logger = get_logger('ActionSystem')
+        logger = _ACTION_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
         target_info = f" against {target.name}" if target and hasattr(target, 'name') else ""
         
         with LoggingContext(creature_name=performer.name, action_name=action_name):
-            logger.info(f"Action attempt: {performer.name} tries {action_name}{target_info}")
+            logger.info("Action attempt: %s tries %s%s", performer.name, action_name, target_info)
     
     @staticmethod
     def log_spell_cast(caster, spell_name, targets=None, spell_level=None):
         """Log spell casting with details."""
-        logger = get_logger('SpellSystem')
-        target_names = []
+        logger = _SPELL_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        target_names = ""
         if targets:
             if hasattr(targets, '__iter__') and not isinstance(targets, str):
-                target_names = [t.name for t in targets if hasattr(t, 'name')]
+                target_names = ', '.join(_get_name(t) for t in targets if hasattr(t, 'name'))
             elif hasattr(targets, 'name'):
-                target_names = [targets.name]
+                target_names = targets.name
         
-        target_info = f" targeting {', '.join(target_names)}" if target_names else ""
+        target_info = f" targeting {target_names}" if target_names else ""
         level_info = f" at level {spell_level}" if spell_level else ""
         
         with LoggingContext(creature_name=caster.name, spell_name=spell_name):
-            logger.info(f"Spell cast: {caster.name} casts {spell_name}{level_info}{target_info}")
+            logger.info("Spell cast: %s casts %s%s%s", caster.name, spell_name, level_info, target_info)
     
     @staticmethod
     def log_damage_dealt(target, damage_amount, damage_type, source=None):
         """Log damage being dealt."""
-        logger = get_logger('DamageSystem')
-        source_info = f" from {source.name}" if source and hasattr(source, 'name') else ""
+        logger = _DAMAGE_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        source_name = getattr(source, 'name', None) if source else None
+        source_info = f" from {source_name}" if source_name is not None else ""
         
         context = {'creature_name': target.name, 'damage_amount': damage_amount, 'damage_type': damage_type}
-        if source and hasattr(source, 'name'):
-            context['damage_source'] = source.name
+        if source_name is not None:
+            context['damage_source'] = source_name
         
         with LoggingContext(**context):
-            logger.info(f"Damage dealt: {target.name} takes {damage_amount} {damage_type} damage{source_info}")
+            logger.info("Damage dealt: %s takes %s %s damage%s", target.name, damage_amount, damage_type, source_info)
     
     @staticmethod
     def log_condition_change(creature, condition, added=True):
         """Log condition additions or removals."""
-        logger = get_logger('ConditionSystem')
+        logger = _CONDITION_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
         action = "gained" if added else "lost"
         
         with LoggingContext(creature_name=creature.name, condition=condition):
-            logger.info(f"Condition change: {creature.name} {action} {condition} condition")
+            logger.info("Condition change: %s %s %s condition", creature.name, action, condition)
     
     @staticmethod
     def log_combat_end(winner=None, reason="Combat ended"):
         """Log the end of combat."""
-        logger = get_logger('CombatSystem')
+        logger = _COMBAT_LOG
+        if not logger.isEnabledFor(logging.INFO):
+            return
         winner_info = f" - Winner: {winner}" if winner else ""
-        logger.info(f"Combat ended: {reason}{winner_info}")
+        logger.info("Combat ended: %s%s", reason, winner_info)
 
 # Utility functions for common logging patterns
 def log_with_performance(operation_name: str, logger_name='Performance'):
@@ -454,7 +737,7 @@ def log_system_health():
 
 # Export enhanced combat logging for use in other modules
 __all__ = [
-    'setup_dnd_logging', 'get_logger', 'dnd_logger', 'log_manager',
+    'setup_dnd_logging', 'get_logger', 'configure_logging', 'dnd_logger', 'log_manager',
     'LoggingContext', 'PerformanceContext', 'EnhancedCombatLogging',
     'log_with_performance', 'log_system_health'
 ]
\ No newline at end of file
@@ -0,0 +1,8 @@
+# File: examples/_bootstrap.py
+"""Puts the project root on sys.path so the example scripts can import the game packages."""
+import os
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
\ No newline at end of file
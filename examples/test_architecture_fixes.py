@@ -1,13 +1,7 @@
 # File: examples/test_architecture_fixes.py
 """Test the architecture improvements - FIXED VERSION."""
 
-import sys
-import os
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 def test_enhanced_error_handling():
     """Test the enhanced error handling systems."""
@@ -1,18 +1,14 @@
 # File: examples/test_critical_hits.py
-import sys
-import os
 
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.beasts.dire_wolf import DireWolf
 from creatures.base import Creature
 from systems.attack_system import AttackSystem
+from core.utils import seed_dice
 
-def test_critical_hits():
-    """Test critical hit mechanics by making many attacks."""
+def test_critical_hits(verbose=False):
+    """Test critical hit mechanics by making many attacks (verbose narrates each one)."""
     
     print("=== TESTING CRITICAL HIT SYSTEM ===\n")
     
@@ -47,16 +43,18 @@ def test_critical_hits():
     print("Making 10 attacks to test for critical hits...")
     print("(Looking for Natural 20s that deal extra damage)\n")
     
-    crits = 0
-    hits = 0
-    
-    for i in range(10):
-        print(f"--- Attack {i+1} ---")
-        if AttackSystem.make_weapon_attack(attacker, target, longsword):
-            hits += 1
-            # Check if it was a crit by looking at the damage output
-            # (This is a simple test - in a real system you'd check the roll directly)
-        print()
+    if verbose:
+        hits = 0
+        for i in range(10):
+            print(f"--- Attack {i+1} ---")
+            if AttackSystem.make_weapon_attack(attacker, target, longsword):
+                hits += 1
+            print()
+    else:
+        # Roll all 10 attacks at once and apply the damage afterwards
+        hits, crits, damage = AttackSystem.make_weapon_attack_batch(attacker, target, longsword, 10)
+        target.take_damage(damage, attacker=attacker)
+        print(f"Critical hits: {crits}, total damage: {damage}")
     
     print(f"Results: {hits} hits out of 10 attacks")
     print(f"Target remaining HP: {target.current_hp}/200")
@@ -79,5 +77,33 @@ def test_critical_hits():
     print("\n=== CRITICAL HIT TEST COMPLETE ===")
     print("Look for 'CRITICAL HIT!' messages above!")
 
+def test_large_attack_batch():
+    """A batch past _PARALLEL_MIN_ATTACKS runs on the parallel numba loop when numba is installed."""
+    from systems.attack_system import _PARALLEL_MIN_ATTACKS
+    
+    target = Creature(name="Training Dummy", level=10, ac=15, hp=200, speed=0, stats={'str': 10})
+    attacker = Creature(name="Fighter", level=5, ac=16, hp=45, speed=30,
+                        stats={'str': 18}, proficiencies={'longsword'})
+    longsword = {'name': 'longsword', 'damage': '1d8', 'ability': 'str', 'proficient': True, 'damage_type': 'slashing'}
+    
+    n = _PARALLEL_MIN_ATTACKS * 2
+    for has_advantage in (False, True):
+        hits, crits, damage = AttackSystem.make_weapon_attack_batch(
+            attacker, target, longsword, n, has_advantage=has_advantage)
+        # +7 to hit against AC 15 lands about 65% of attacks (88% with advantage)
+        assert 0 < crits <= hits <= n
+        assert 0.5 * n < hits
+        # Every hit deals 1d8+4, or 2d8+4 on a crit
+        assert 5 * hits <= damage <= 12 * hits + 8 * crits
+    print(f"Batch of {n}: {hits} hits, {crits} crits, {damage} damage")
+    
+    # Seeding replays the batch exactly, however many threads roll it
+    results = []
+    for _ in range(2):
+        seed_dice(20)
+        results.append(AttackSystem.make_weapon_attack_batch(attacker, target, longsword, n))
+    assert results[0] == results[1]
+
 if __name__ == "__main__":
+    test_large_attack_batch()
     test_critical_hits()
\ No newline at end of file
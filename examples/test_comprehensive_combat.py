@@ -1,12 +1,7 @@
 # File: examples/test_comprehensive_combat_fixed.py
 """Fixed comprehensive combat test with updated Dire Wolf integration."""
-import sys
-import os
 
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 # Import only existing modules
 from creatures.base import Creature
@@ -276,5 +271,20 @@ def test_comprehensive_combat():
     print("The ActionExecutionSystem successfully manages all existing actions!")
     print("Dire Wolf integration is now fully compliant with ActionExecutor!")
 
+def test_stateless_action_instances():
+    """Dash and Dodge share one instance per class; subclasses get their own."""
+    from actions import DASH_ACTION, DODGE_ACTION
+    
+    class SprintAction(DashAction):
+        __slots__ = ()
+    
+    assert DashAction() is DASH_ACTION
+    assert DodgeAction() is DODGE_ACTION
+    sprint = SprintAction()
+    assert type(sprint) is SprintAction and sprint is not DASH_ACTION
+    assert SprintAction() is sprint
+    print("✅ Stateless actions share one instance per class")
+
 if __name__ == "__main__":
-    test_comprehensive_combat()
\ No newline at end of file
+    test_comprehensive_combat()
+    test_stateless_action_instances()
\ No newline at end of file
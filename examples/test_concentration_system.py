@@ -2,9 +2,7 @@
 # File: examples/test_concentration_system.py
 """Test the D&D 2024 Concentration System implementation."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_concentration_basics():
     """Test basic concentration functionality."""
@@ -2,9 +2,7 @@
 # File: examples/test_condition_enhancement.py
 """Test the enhanced condition system in place."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_enhanced_conditions():
     """Test that the enhanced condition system works."""
@@ -1,11 +1,6 @@
 # File: examples/test_damage_resistance_spells.py
-import sys
-import os
 
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.damage_resistance_system import DamageResistanceSystem, DamageType, patch_creature_damage_system
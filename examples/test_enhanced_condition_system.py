@@ -2,9 +2,7 @@
 # File: examples/test_enhanced_condition_system.py
 """Test the Enhanced Condition System implementation."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_condition_duration_tracking():
     """Test basic condition duration functionality."""
@@ -1,15 +1,9 @@
 # File: examples/test_enhanced_systems.py
 """Comprehensive test suite for enhanced error handling and logging systems."""
 
-import sys
-import os
 import time
 import json
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 def test_enhanced_error_handling():
     """Test all new error handling features."""
@@ -33,7 +27,7 @@ def test_enhanced_error_handling():
             recovery_suggestion="This is a test - no action needed"
         )
     except DnDError as e:
-        print(f"✅ Error severity: {e.severity.value}")
+        print(f"✅ Error severity: {e.severity.label}")
         print(f"✅ Error context: {e.context}")
         print(f"✅ Recovery suggestion: {e.recovery_suggestion}")
     
@@ -399,6 +393,83 @@ def test_json_logging_output():
     
     print("\n✅ JSON logging test completed!")
 
+def test_validation_cache_reports_missing_hp():
+    """Test that a creature missing HP still fails validation after its class was cached."""
+    print("\n=== TESTING CACHED CREATURE VALIDATION ===\n")
+    
+    from creatures.base import Creature
+    from error_handling.error_handler import DnDErrorHandler, DnDError
+    
+    healthy = Creature(name="Healthy", level=1, ac=10, hp=10, speed=30, stats={})
+    DnDErrorHandler.validate_creature(healthy)
+    
+    broken = Creature(name="Broken", level=1, ac=10, hp=10, speed=30, stats={})
+    del broken.current_hp
+    try:
+        DnDErrorHandler.validate_creature(broken, "damage application")
+    except DnDError as e:
+        assert e.context['missing_attributes'] == ['current_hp']
+        print(f"✅ Missing HP reported as DnDError: {e}")
+    else:
+        raise AssertionError("validate_creature accepted a creature without current_hp")
+
+def test_json_logging_exception():
+    """Test that exceptions logged through the queue keep their traceback in JSON output."""
+    print("\n=== TESTING JSON EXCEPTION LOGGING ===\n")
+    
+    import io
+    import logging
+    import queue
+    from logging.handlers import QueueListener
+    from error_handling.logging_setup import RecordQueueHandler, JSONFormatter
+    
+    # Same queue arrangement LogManager uses for its file handlers
+    stream = io.StringIO()
+    json_handler = logging.StreamHandler(stream)
+    json_handler.setFormatter(JSONFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, json_handler)
+    
+    logger = logging.getLogger('dnd.test.json_exception')
+    logger.propagate = False
+    queue_handler = RecordQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener.start()
+    try:
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            logger.exception("Damage calculation failed for %s", "Goblin")
+    finally:
+        listener.stop()
+        logger.removeHandler(queue_handler)
+    
+    entry = json.loads(stream.getvalue().splitlines()[-1])
+    assert entry['message'] == "Damage calculation failed for Goblin"
+    assert 'ZeroDivisionError' in entry['exception']
+    assert 'Traceback' not in entry['message']
+    print(f"✅ Exception field kept: {entry['exception'].splitlines()[-1]}")
+
+def test_context_keeps_record_fields():
+    """Test that context keys named like LogRecord attributes don't replace them."""
+    print("\n=== TESTING CONTEXT WITH RESERVED NAMES ===\n")
+    
+    import logging
+    from error_handling.logging_setup import ContextFilter, JSONFormatter
+    
+    context_filter = ContextFilter()
+    context_filter.set_context(name="ctxname", msg="context message", creature_name="Goblin")
+    record = logging.makeLogRecord({'name': 'dnd.test', 'msg': "Goblin attacks", 'levelname': 'INFO'})
+    context_filter.filter(record)
+    
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry['logger'] == 'dnd.test'
+    assert entry['message'] == "Goblin attacks"
+    assert entry['creature_name'] == "Goblin"
+    assert record.context_name == "ctxname"
+    assert record.context_msg == "context message"
+    print("✅ Reserved context keys stored as context_name / context_msg")
+
 def test_log_file_management():
     """Test log file creation and management."""
     print("\n=== TESTING LOG FILE MANAGEMENT ===\n")
@@ -441,6 +512,9 @@ def run_all_tests():
         test_enhanced_logging()
         test_integration_with_existing_systems()
         test_json_logging_output()
+        test_validation_cache_reports_missing_hp()
+        test_json_logging_exception()
+        test_context_keeps_record_fields()
         test_log_file_management()
         
         print("\n" + "="*70)
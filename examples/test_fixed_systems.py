@@ -1,13 +1,7 @@
 # File: examples/test_fixed_systems.py
 """Test script demonstrating the fixed high-priority systems."""
 
-import sys
-import os
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from creatures.beasts.dire_wolf import DireWolf, DireWolfBiteAction
@@ -1,8 +1,7 @@
 # File: examples/test_global_access.py
 """Demonstrate the new global access capabilities without breaking existing functionality."""
 
-import sys, os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_original_imports():
     """Test that all original import patterns still work."""
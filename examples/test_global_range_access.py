@@ -3,7 +3,7 @@
 
 import sys
 import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_global_systems_import():
     """Test importing range systems through global systems."""
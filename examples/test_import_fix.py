@@ -1,13 +1,7 @@
 # File: examples/test_import_fix.py
 """Quick test to verify the import fix works."""
 
-import sys
-import os
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 def test_imports():
     """Test that all enhanced imports work correctly."""
@@ -47,7 +41,7 @@ def test_imports():
                 recovery_suggestion="This is just a test"
             )
         except DnDError as e:
-            print(f"✅ Error severity: {e.severity.value}")
+            print(f"✅ Error severity: {e.severity.label}")
             print(f"✅ Recovery: {e.recovery_suggestion}")
         
         print("\n--- Testing Context Logging ---")
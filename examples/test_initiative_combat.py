@@ -1,11 +1,6 @@
 # File: examples/test_initiative_combat.py
-import sys
-import os
 
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from creatures.beasts.dire_wolf import DireWolf
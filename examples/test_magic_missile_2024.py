@@ -1,13 +1,7 @@
 # File: examples/test_magic_missile_2024.py
 """Test Magic Missile using ONLY the existing global systems - NO HARDCODING."""
 
-import sys
-import os
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 def test_magic_missile_through_global_systems():
     """Test Magic Missile using ONLY existing global systems and files."""
@@ -1,13 +1,7 @@
 # File: examples/test_official_dire_wolf.py
 """Test the corrected Dire Wolf with official D&D 2024 stats and mechanics."""
 
-import sys
-import os
-
-# Add the project root to Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.beasts.dire_wolf import DireWolf, DireWolfBiteAction, DireWolfStealthAction
 from creatures.base import Creature
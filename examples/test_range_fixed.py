@@ -2,9 +2,7 @@
 # File: examples/test_range_fixed.py
 """FIXED range integration test - addresses all the errors found."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.positioning_system import battlefield, Position, CreatureSize
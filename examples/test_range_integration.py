@@ -1,9 +1,7 @@
 # File: examples/test_range_integration.py
 """Comprehensive test for range and positioning integration across all combat systems."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.positioning_system import battlefield, Position, CreatureSize
@@ -1,5 +1,4 @@
-import sys, os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.positioning_system import battlefield, Position, CreatureSize
@@ -1,9 +1,7 @@
 # File: examples/test_range_simple.py
 """Simple test for range integration to verify core functionality."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.positioning_system import battlefield, Position, CreatureSize
@@ -2,9 +2,7 @@
 # File: examples/test_social_interaction_integration.py
 """Test the Social Interaction DC Consistency integration with error handling."""
 
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 def test_basic_social_dc_integration():
     """Test basic social DC integration with the d20 system."""
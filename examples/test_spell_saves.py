@@ -1,12 +1,7 @@
 # File: examples/test_spell_saves.py
 # Test script to verify the spell save fix works
-import sys
-import os
 
-# Add the project root to Python path (go up one directory from examples/)
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+import _bootstrap  # puts the project root on sys.path
 
 from creatures.base import Creature
 from systems.character_abilities.spellcasting import SpellcastingManager
@@ -1,8 +1,5 @@
-import sys
-import os
 
-# This line ensures the script can find the other project files
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import _bootstrap  # puts the project root on sys.path
 
 # Import the functions we are testing from our global system
 from core.utils import get_ability_modifier, roll_dice, roll_d100, roll_d3
@@ -2,7 +2,7 @@
 """Magic Missile 1st-level spell - standardized damage system."""
 
 from spells.spells_base import BaseSpell
-from core.utils import roll_dice
+from core.utils import roll_dice_batch
 from error_handling import DnDErrorHandler
 
 class MagicMissile(BaseSpell):
@@ -42,6 +42,9 @@ class MagicMissile(BaseSpell):
                 missiles_per_target[target] = 0
             missiles_per_target[target] += 1
 
+        # Roll every dart's 1d4 up front; darts at defeated targets go unused
+        dart_rolls = iter(roll_dice_batch(num_missiles, 1, 4))
+
         # Apply damage to each target using STANDARDIZED damage system
         for target, missile_count in missiles_per_target.items():
             if not target.is_alive:
@@ -55,7 +58,7 @@ class MagicMissile(BaseSpell):
             damage_breakdown = []
             
             for missile in range(missile_count):
-                missile_damage = roll_dice("1d4") + 1  # Each missile: 1d4+1
+                missile_damage = next(dart_rolls) + 1  # Each missile: 1d4+1
                 total_damage += missile_damage
                 damage_breakdown.append(str(missile_damage))
             
@@ -3,7 +3,7 @@
 
 from spells.spells_base import BaseSpell
 from systems.spell_system.spell_manager import SpellManager
-from core.utils import roll_dice
+from core.utils import roll_dice_batch
 
 class Fireball(BaseSpell):
     """
@@ -65,8 +65,11 @@ class Fireball(BaseSpell):
         damage_dice = f"{total_dice}d6"
         print(f"** Fireball damage: {damage_dice} fire damage **")
 
+        # Roll every target's damage in one batch; each creature still gets its own roll
+        damage_rolls = roll_dice_batch(len(targets), total_dice, 6)
+
         # Each creature in area makes a Dex save
-        for target in targets:
+        for target, rolled_damage in zip(targets, damage_rolls):
             if not target or not target.is_alive:
                 continue
 
@@ -74,13 +77,13 @@ class Fireball(BaseSpell):
 
             if SpellManager.make_spell_save(target, caster, self, "dex"):
                 # Success: Half damage (rounded down)
-                full_damage = roll_dice(damage_dice)
+                full_damage = rolled_damage
                 half_damage = full_damage // 2  # Half damage, rounded down
                 print(f"** {target.name} succeeds and takes {half_damage} fire damage! (half of {full_damage}) **")
                 damage = half_damage
             else:
                 # Failure: Full damage
-                damage = roll_dice(damage_dice)
+                damage = rolled_damage
                 print(f"** {target.name} fails and takes {damage} fire damage! ({damage_dice}) **")
             
             # Apply damage with resistance system
@@ -3,6 +3,9 @@
 
 class BaseSpell:
     """Base class for all spells."""
+
+    # Spells that require concentration override this
+    concentration = False
     
     def __init__(self, name, level, school, casting_time="1 Action", 
                  range_type="60 feet", components="V, S", duration="Instantaneous",
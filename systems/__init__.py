@@ -3,7 +3,7 @@
 
 # Core systems - most frequently used
 from .d20_system import perform_d20_test, was_last_roll_critical
-from .attack_system import AttackSystem, WeaponRanges
+from .attack_system import AttackSystem, WeaponRanges, WeaponData
 from .combat_manager import combat_manager
 from .spell_system.spell_manager import SpellManager
 from .condition_system import add_condition, remove_condition, has_condition
@@ -20,7 +20,7 @@ from .condition_system import DurationType, process_end_of_turn_saves, update_co
 
 __all__ = [
     'perform_d20_test', 'was_last_roll_critical',
-    'AttackSystem', 'WeaponRanges',
+    'AttackSystem', 'WeaponRanges', 'WeaponData',
     'combat_manager', 
     'SpellManager',
     'add_condition', 'remove_condition', 'has_condition',
@@ -1,9 +1,17 @@
 # File: systems/action_economy.py
 """Action Economy System - Tracks actions, bonus actions, movement, and reactions per turn."""
+import logging
+
+logger = logging.getLogger('dnd.actions')
 
 class ActionEconomy:
     """Manages action economy for a creature during combat."""
     
+    __slots__ = (
+        'creature', 'action_used', 'bonus_action_used', 'reaction_used',
+        'movement_used', 'free_object_interaction_used'
+    )
+    
     def __init__(self, creature):
         self.creature = creature
         self.reset_turn()
@@ -19,7 +27,7 @@ class ActionEconomy:
         # Reset movement to creature's speed
         self.creature.movement_for_turn = self.creature.speed
         
-        print(f"  > {self.creature.name}'s action economy reset for new turn")
+        logger.debug("  > %s's action economy reset for new turn", self.creature.name)
     
     def can_take_action(self):
         """Check if the creature can take an action."""
@@ -41,53 +49,53 @@ class ActionEconomy:
     def use_action(self, action_name="Action"):
         """Use the creature's action."""
         if not self.can_take_action():
-            print(f"  > {self.creature.name} cannot take an action (already used or incapacitated)")
+            logger.debug("  > %s cannot take an action (already used or incapacitated)", self.creature.name)
             return False
         
         self.action_used = True
-        print(f"  > {self.creature.name} uses their Action: {action_name}")
+        logger.debug("  > %s uses their Action: %s", self.creature.name, action_name)
         return True
     
     def use_bonus_action(self, action_name="Bonus Action"):
         """Use the creature's bonus action."""
         if not self.can_take_bonus_action():
-            print(f"  > {self.creature.name} cannot take a bonus action (already used or incapacitated)")
+            logger.debug("  > %s cannot take a bonus action (already used or incapacitated)", self.creature.name)
             return False
         
         self.bonus_action_used = True
-        print(f"  > {self.creature.name} uses their Bonus Action: {action_name}")
+        logger.debug("  > %s uses their Bonus Action: %s", self.creature.name, action_name)
         return True
     
     def use_reaction(self, reaction_name="Reaction"):
         """Use the creature's reaction."""
         if not self.can_take_reaction():
-            print(f"  > {self.creature.name} cannot take a reaction (already used or incapacitated)")
+            logger.debug("  > %s cannot take a reaction (already used or incapacitated)", self.creature.name)
             return False
         
         self.reaction_used = True
-        print(f"  > {self.creature.name} uses their Reaction: {reaction_name}")
+        logger.debug("  > %s uses their Reaction: %s", self.creature.name, reaction_name)
         return True
     
     def use_movement(self, distance, movement_type="move"):
         """Use movement."""
         if not self.can_move(distance):
             remaining = self.creature.movement_for_turn - self.movement_used
-            print(f"  > {self.creature.name} cannot move {distance} feet (only {remaining} feet remaining)")
+            logger.debug("  > %s cannot move %s feet (only %s feet remaining)", self.creature.name, distance, remaining)
             return False
         
         self.movement_used += distance
-        remaining = self.creature.movement_for_turn - self.movement_used
-        print(f"  > {self.creature.name} moves {distance} feet ({movement_type}). {remaining} feet remaining.")
+        logger.debug("  > %s moves %s feet (%s). %s feet remaining.", self.creature.name, distance, movement_type,
+                     self.creature.movement_for_turn - self.movement_used)
         return True
     
     def use_free_object_interaction(self, interaction="interact with object"):
         """Use the free object interaction."""
         if self.free_object_interaction_used:
-            print(f"  > {self.creature.name} has already used their free object interaction this turn")
+            logger.debug("  > %s has already used their free object interaction this turn", self.creature.name)
             return False
         
         self.free_object_interaction_used = True
-        print(f"  > {self.creature.name} uses their free object interaction: {interaction}")
+        logger.debug("  > %s uses their free object interaction: %s", self.creature.name, interaction)
         return True
     
     def get_status(self):
@@ -108,6 +116,19 @@ class ActionEconomy:
         for resource, state in status.items():
             print(f"  {resource.replace('_', ' ').title()}: {state}")
 
+# Action type name -> ActionEconomy check/spend method, so a type string is resolved
+# with one dict lookup instead of repeated lower() calls and comparisons. Other
+# systems spend resources through ActionEconomyManager rather than their own copy.
+_CAN_TAKE = {
+    'action': ActionEconomy.can_take_action,
+    'bonus_action': ActionEconomy.can_take_bonus_action,
+    'reaction': ActionEconomy.can_take_reaction,
+}
+_USE = {
+    'action': ActionEconomy.use_action,
+    'bonus_action': ActionEconomy.use_bonus_action,
+    'reaction': ActionEconomy.use_reaction,
+}
 
 class ActionEconomyManager:
     """Global manager for action economy across all creatures."""
@@ -117,9 +138,10 @@ class ActionEconomyManager:
     @classmethod
     def get_economy(cls, creature):
         """Get or create action economy for a creature."""
-        if creature not in cls._creature_economies:
-            cls._creature_economies[creature] = ActionEconomy(creature)
-        return cls._creature_economies[creature]
+        economy = cls._creature_economies.get(creature)
+        if economy is None:
+            economy = cls._creature_economies[creature] = ActionEconomy(creature)
+        return economy
     
     @classmethod
     def start_turn(cls, creature):
@@ -131,31 +153,19 @@ class ActionEconomyManager:
     @classmethod
     def can_take_action(cls, creature, action_type="action"):
         """Check if a creature can take a specific type of action."""
-        economy = cls.get_economy(creature)
-        
-        if action_type.lower() == "action":
-            return economy.can_take_action()
-        elif action_type.lower() == "bonus_action":
-            return economy.can_take_bonus_action()
-        elif action_type.lower() == "reaction":
-            return economy.can_take_reaction()
-        else:
+        can_take = _CAN_TAKE.get(action_type) or _CAN_TAKE.get(action_type.lower())
+        if can_take is None:
             return False
+        return can_take(cls.get_economy(creature))
     
     @classmethod
     def use_action(cls, creature, action_name, action_type="action"):
         """Use an action for a creature."""
-        economy = cls.get_economy(creature)
-        
-        if action_type.lower() == "action":
-            return economy.use_action(action_name)
-        elif action_type.lower() == "bonus_action":
-            return economy.use_bonus_action(action_name)
-        elif action_type.lower() == "reaction":
-            return economy.use_reaction(action_name)
-        else:
-            print(f"Unknown action type: {action_type}")
+        use = _USE.get(action_type) or _USE.get(action_type.lower())
+        if use is None:
+            logger.warning("Unknown action type: %s", action_type)
             return False
+        return use(cls.get_economy(creature), action_name)
     
     @classmethod
     def use_movement(cls, creature, distance, movement_type="move"):
@@ -1,10 +1,16 @@
 # File: systems/action_execution_system.py
 """Centralized Action Execution System - Manages ALL action execution in the game."""
+import functools
+import logging
+from typing import NamedTuple
 
 from systems.action_economy import ActionEconomyManager
+from systems.attack_system import WeaponData, WeaponRanges
 from systems.cover_system import RangeSystem, CoverSystem
 from systems.positioning_system import battlefield
 
+logger = logging.getLogger('dnd.actions')
+
 class ActionType:
     """Constants for action types."""
     ACTION = "action"
@@ -12,12 +18,48 @@ class ActionType:
     REACTION = "reaction"
     FREE_ACTION = "free_action"
 
-class ActionResult:
-    """Result of an action execution."""
-    def __init__(self, success=False, message="", action_used=False):
-        self.success = success
-        self.message = message
-        self.action_used = action_used
+class ActionResult(NamedTuple):
+    """Result of an action execution (immutable, so common results are shared)."""
+    success: bool = False
+    message: str = ""
+    action_used: bool = False
+
+_RANGE_CHECK_PASSED = ActionResult(True, "Range check passed")
+_RANGE_CHECK_BYPASSED = ActionResult(True, "Range check bypassed due to error")
+
+# Results that only vary by creature, action type or action name are built once per combination
+@functools.lru_cache(maxsize=256)
+def _cannot_act_result(performer_name, action_type):
+    return ActionResult(False, f"{performer_name} cannot take a {action_type}")
+
+@functools.lru_cache(maxsize=256)
+def _already_used_result(performer_name, action_type):
+    return ActionResult(False, f"{performer_name} has already used their {action_type}")
+
+@functools.lru_cache(maxsize=256)
+def _outcome_result(action_name, success):
+    return ActionResult(success, f"{action_name} {'succeeded' if success else 'failed'}", True)
+
+# Action names that imply a touch (5 ft) range
+_TOUCH_ACTIONS = ('help', 'grapple', 'shove', 'stabilize')
+
+# Action names that total cover blocks
+_OFFENSIVE_KEYWORDS = ('attack', 'damage', 'harm', 'spell', 'fire', 'lightning', 'force')
+
+# A combat reuses a few dozen action names, so their name-based traits are memoized
+@functools.lru_cache(maxsize=256)
+def _action_name_traits(action_name):
+    """
+    Classifies an action by name. Returns (names_a_ranged_action, is_touch, is_offensive):
+    attack/spell names always need a range check, touch names default to 5 ft, and
+    offensive names are blocked by total cover.
+    """
+    name = action_name.lower()
+    return (
+        'attack' in name or 'spell' in name,
+        any(touch_action in name for touch_action in _TOUCH_ACTIONS),
+        any(keyword in name for keyword in _OFFENSIVE_KEYWORDS),
+    )
 
 class ActionExecutionSystem:
     """The central system that manages ALL action execution."""
@@ -30,7 +72,7 @@ class ActionExecutionSystem:
         
         # Validate the action can be performed
         if not ActionExecutionSystem._validate_action(performer, action_type):
-            return ActionResult(False, f"{performer.name} cannot take a {action_type}")
+            return _cannot_act_result(performer.name, action_type)
         
         # Range validation for targeted actions
         if target and ActionExecutionSystem._action_requires_range_check(action_instance):
@@ -42,10 +84,11 @@ class ActionExecutionSystem:
         
         # Consume the action resource FIRST
         if not ActionExecutionSystem._consume_resource(performer, action_type, action_instance.name):
-            return ActionResult(False, f"{performer.name} has already used their {action_type}")
+            return _already_used_result(performer.name, action_type)
         
         # Log the action
-        print(f"\n--- {performer.name}'s {action_type.replace('_', ' ').title()}: {action_instance.name} ---")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n--- %s's %s: %s ---", performer.name, action_type.replace('_', ' ').title(), action_instance.name)
         
         try:
             # Execute the actual action
@@ -54,7 +97,7 @@ class ActionExecutionSystem:
             else:
                 success = action_instance.execute(performer, **kwargs)
             
-            return ActionResult(success, f"{action_instance.name} {'succeeded' if success else 'failed'}", True)
+            return _outcome_result(action_instance.name, bool(success))
             
         except Exception as e:
             # If action fails, refund the resource
@@ -77,18 +120,10 @@ class ActionExecutionSystem:
     @staticmethod
     def _consume_resource(performer, action_type, action_name):
         """Consume the appropriate action resource."""
-        economy = ActionEconomyManager.get_economy(performer)
-        
-        if action_type == ActionType.ACTION:
-            return economy.use_action(action_name)
-        elif action_type == ActionType.BONUS_ACTION:
-            return economy.use_bonus_action(action_name)
-        elif action_type == ActionType.REACTION:
-            return economy.use_reaction(action_name)
-        elif action_type == ActionType.FREE_ACTION:
+        if action_type == ActionType.FREE_ACTION:
             return True  # Free actions don't consume resources
         
-        return False
+        return ActionEconomyManager.use_action(performer, action_name, action_type)
     
     @staticmethod
     def _refund_resource(performer, action_type):
@@ -105,12 +140,10 @@ class ActionExecutionSystem:
     @staticmethod
     def _action_requires_range_check(action_instance):
         """Check if an action requires range validation."""
-        # Attack actions always need range checks
-        if hasattr(action_instance, 'weapon_data') or 'attack' in action_instance.name.lower():
-            return True
+        names_a_ranged_action, is_touch, _ = _action_name_traits(action_instance.name)
         
-        # Spell actions need range checks
-        if hasattr(action_instance, 'spell') or 'spell' in action_instance.name.lower():
+        # Attack and spell actions always need range checks
+        if names_a_ranged_action or hasattr(action_instance, 'weapon_data') or hasattr(action_instance, 'spell'):
             return True
         
         # Actions with explicit range requirements
@@ -118,11 +151,7 @@ class ActionExecutionSystem:
             return getattr(action_instance, 'requires_range_check', True)
         
         # Touch-based actions (help, etc.) need range checks
-        touch_actions = ['help', 'grapple', 'shove', 'stabilize']
-        if any(touch_action in action_instance.name.lower() for touch_action in touch_actions):
-            return True
-        
-        return False
+        return is_touch
     
     @staticmethod
     def _validate_action_range(performer, target, action_instance):
@@ -150,14 +179,14 @@ class ActionExecutionSystem:
             
             # Range check passed
             if range_check['disadvantage']:
-                print(f"  > {target.name} is at long range (Distance: {range_check['distance']} feet) - may affect roll")
+                logger.debug("  > %s is at long range (Distance: %s feet) - may affect roll", target.name, range_check['distance'])
             
-            return ActionResult(True, "Range check passed")
+            return _RANGE_CHECK_PASSED
             
         except Exception as e:
             # If range checking fails, assume action can proceed
-            print(f"  > Warning: Range check failed ({e}), proceeding with action")
-            return ActionResult(True, "Range check bypassed due to error")
+            logger.warning("  > Warning: Range check failed (%s), proceeding with action", e)
+            return _RANGE_CHECK_BYPASSED
     
     @staticmethod
     def _get_action_range(action_instance):
@@ -169,10 +198,13 @@ class ActionExecutionSystem:
         # Weapon-based actions
         if hasattr(action_instance, 'weapon_data'):
             weapon_data = action_instance.weapon_data
-            if isinstance(weapon_data, dict) and 'range' in weapon_data:
+            if isinstance(weapon_data, WeaponData):
+                if weapon_data.range is not None:
+                    return weapon_data.range
+                return WeaponRanges.get_weapon_range(weapon_data.name)
+            elif isinstance(weapon_data, dict) and 'range' in weapon_data:
                 return weapon_data['range']
             elif isinstance(weapon_data, dict) and 'name' in weapon_data:
-                from systems.attack_system import WeaponRanges
                 return WeaponRanges.get_weapon_range(weapon_data['name'])
         
         # Spell-based actions
@@ -182,10 +214,9 @@ class ActionExecutionSystem:
                 return ActionExecutionSystem._parse_spell_range(spell.range_type)
         
         # Default ranges for common actions
-        action_name = action_instance.name.lower()
-        if any(touch in action_name for touch in ['help', 'grapple', 'shove', 'stabilize']):
+        if _action_name_traits(action_instance.name)[1]:
             return 5  # Touch range
-        elif 'throw' in action_name:
+        elif 'throw' in action_instance.name.lower():
             return (20, 60)  # Typical thrown weapon range
         
         # Default melee range
@@ -194,9 +225,7 @@ class ActionExecutionSystem:
     @staticmethod
     def _is_offensive_action(action_instance):
         """Check if an action is offensive and should be blocked by total cover."""
-        offensive_keywords = ['attack', 'damage', 'harm', 'spell', 'fire', 'lightning', 'force']
-        action_name = action_instance.name.lower()
-        return any(keyword in action_name for keyword in offensive_keywords)
+        return _action_name_traits(action_instance.name)[2]
     
     @staticmethod
     def _parse_spell_range(range_string):
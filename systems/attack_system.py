@@ -1,15 +1,165 @@
 # File: systems/attack_system.py (ENHANCED VERSION)
 """Global attack system with enhanced error handling."""
 
-from systems.d20_system import perform_d20_test, was_last_roll_critical
-from core.utils import roll_dice
+from systems.d20_system import perform_d20_test
+from core.utils import roll_dice, roll_parsed_dice, parse_dice_notation, get_rng
 from systems.cover_system import RangeSystem, CoverSystem
 from systems.positioning_system import battlefield
+from typing import Any, NamedTuple
+import functools
 import logging
+import random
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; batched attacks run as plain Python
+    njit = None
+    prange = range
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; used for batched attacks when numba is absent
+    np = None
 
 # Set up logging
 logger = logging.getLogger('AttackSystem')
 
+def _roll_weapon_attacks(n, attack_bonus, target_ac, num_dice, die_type, damage_bonus, advantage):
+    """
+    Numeric core of AttackSystem.make_weapon_attack_batch. advantage is 1 for
+    advantage, -1 for disadvantage and 0 for a straight roll.
+    Returns (hits, crits, total_damage).
+    """
+    hits = 0
+    crits = 0
+    total_damage = 0
+    for _ in range(n):
+        d20 = random.randint(1, 20)
+        if advantage > 0:
+            d20 = max(d20, random.randint(1, 20))
+        elif advantage < 0:
+            d20 = min(d20, random.randint(1, 20))
+        # Natural 1 always misses, natural 20 always hits
+        if d20 == 1 or (d20 != 20 and d20 + attack_bonus < target_ac):
+            continue
+        dice = num_dice
+        if d20 == 20:
+            # Critical hit: double the dice, not the modifiers
+            crits += 1
+            dice *= 2
+        damage = damage_bonus
+        for _ in range(dice):
+            damage += random.randint(1, die_type)
+        hits += 1
+        total_damage += max(1, damage)
+    return hits, crits, total_damage
+
+def _roll_weapon_attacks_vectorized(n, attack_bonus, target_ac, num_dice, die_type, damage_bonus, advantage):
+    """numpy version of _roll_weapon_attacks that rolls every attack at once."""
+    rng = get_rng()
+    rolls = rng.integers(1, 21, size=(n, 2 if advantage else 1))
+    d20 = rolls.min(axis=1) if advantage < 0 else rolls.max(axis=1)
+    crit_mask = d20 == 20
+    hit_mask = crit_mask | ((d20 != 1) & (d20 + attack_bonus >= target_ac))
+    damage = rng.integers(1, die_type + 1, size=(n, num_dice)).sum(axis=1) + damage_bonus
+    damage += np.where(crit_mask, rng.integers(1, die_type + 1, size=(n, num_dice)).sum(axis=1), 0)
+    damage = np.maximum(damage, 1)
+    return int(hit_mask.sum()), int(crit_mask.sum()), int(damage[hit_mask].sum())
+
+# Batches at least this large are worth starting numba's thread pool for
+_PARALLEL_MIN_ATTACKS = 10000
+# Attacks rolled from one seed by the parallel loop
+_PARALLEL_CHUNK_SIZE = 4096
+
+def _roll_weapon_attacks_parallel(n, attack_bonus, target_ac, num_dice, die_type, damage_bonus, advantage,
+                                  chunk_seeds):
+    """
+    _roll_weapon_attacks with the attacks spread across cores by numba's prange.
+    Each chunk of _PARALLEL_CHUNK_SIZE attacks reseeds the RNG of the thread that
+    runs it from chunk_seeds, so a batch replays exactly whatever the scheduling;
+    the three totals are reductions.
+    """
+    hits = 0
+    crits = 0
+    total_damage = 0
+    for chunk in prange(len(chunk_seeds)):
+        random.seed(chunk_seeds[chunk])
+        chunk_hits = 0
+        chunk_crits = 0
+        chunk_damage = 0
+        start = chunk * _PARALLEL_CHUNK_SIZE
+        for _i in range(start, min(n, start + _PARALLEL_CHUNK_SIZE)):
+            d20 = random.randint(1, 20)
+            if advantage > 0:
+                d20 = max(d20, random.randint(1, 20))
+            elif advantage < 0:
+                d20 = min(d20, random.randint(1, 20))
+            if d20 != 1 and (d20 == 20 or d20 + attack_bonus >= target_ac):
+                dice = num_dice
+                if d20 == 20:
+                    chunk_crits += 1
+                    dice = num_dice * 2
+                damage = damage_bonus
+                for _d in range(dice):
+                    damage += random.randint(1, die_type)
+                chunk_hits += 1
+                chunk_damage += max(1, damage)
+        hits += chunk_hits
+        crits += chunk_crits
+        total_damage += chunk_damage
+    return hits, crits, total_damage
+
+# Prefer the compiled loop, built eagerly for its one signature so the first
+# batch does not pay for compilation; otherwise roll the whole batch with numpy.
+# The parallel loop compiles on first use, since only large batches need it.
+if njit is not None:
+    _roll_weapon_attacks = njit('UniTuple(int64, 3)(int64, int64, int64, int64, int64, int64, int64)',
+                                cache=True, nogil=True)(_roll_weapon_attacks)
+    _roll_weapon_attacks_parallel = njit(parallel=True, cache=True)(_roll_weapon_attacks_parallel)
+else:
+    _roll_weapon_attacks_parallel = None
+    if np is not None:
+        _roll_weapon_attacks = _roll_weapon_attacks_vectorized
+
+class WeaponData(NamedTuple):
+    """Immutable description of the weapon used for an attack."""
+    name: str
+    damage: str
+    ability: str = 'str'
+    proficient: bool = True
+    damage_type: str = 'bludgeoning'
+    range: Any = None  # None means look the range up by weapon name
+    special_effects: tuple = ()
+
+    @classmethod
+    def from_dict(cls, weapon_dict):
+        """Build WeaponData from a legacy weapon dict, defaulting any missing fields."""
+        missing_fields = [field for field in ('name', 'damage', 'ability', 'damage_type') if field not in weapon_dict]
+        if missing_fields:
+            logger.warning(f"Weapon data missing fields: {missing_fields}")
+        fields = (
+            weapon_dict.get('name', 'Unknown Weapon'),
+            weapon_dict.get('damage', '1d6'),
+            weapon_dict.get('ability', 'str'),
+            weapon_dict.get('proficient', False),
+            weapon_dict.get('damage_type', 'bludgeoning'),
+            weapon_dict.get('range'),
+            tuple(weapon_dict.get('special_effects', ()))
+        )
+        if cls is not WeaponData:
+            return cls(*fields)
+        try:
+            return _cached_weapon_data(fields)
+        except TypeError:  # unhashable field value, e.g. a list range
+            return cls(*fields)
+
+# Legacy dict weapons are converted on every attack; equal dicts share one WeaponData
+@functools.lru_cache(maxsize=128)
+def _cached_weapon_data(fields):
+    return WeaponData(*fields)
+
+UNARMED_STRIKE = WeaponData('Unarmed Strike', '1+0')
+
 class WeaponRanges:
     """Standard weapon ranges for D&D 2024."""
     
@@ -93,8 +243,12 @@ class AttackSystem:
     """Centralized system for handling all attack types with enhanced error handling and range validation."""
     
     @staticmethod
-    def make_weapon_attack(attacker, target, weapon_data, attacker_is_within_5_feet=True):
-        """Make a weapon attack with enhanced error handling."""
+    def make_weapon_attack(attacker, target, weapon_data, attacker_is_within_5_feet=True, damage_spec=None):
+        """
+        Make a weapon attack with enhanced error handling.
+        damage_spec is an optional pre-parsed (num_dice, die_type, modifier) for
+        weapon_data's damage, so repeated attacks skip re-parsing the notation.
+        """
         try:
             # Input validation
             if not attacker:
@@ -118,34 +272,18 @@ class AttackSystem:
             # Validate weapon data
             if not weapon_data:
                 logger.warning("No weapon data provided, using unarmed strike")
-                weapon_data = {
-                    'name': 'Unarmed Strike',
-                    'damage': '1+0',
-                    'ability': 'str',
-                    'proficient': True,
-                    'damage_type': 'bludgeoning'
-                }
-            
-            # Validate required weapon data fields
-            required_fields = ['name', 'damage', 'ability', 'damage_type']
-            missing_fields = [field for field in required_fields if field not in weapon_data]
-            if missing_fields:
-                logger.warning(f"Weapon data missing fields: {missing_fields}")
-                # Fill in defaults
-                defaults = {
-                    'name': 'Unknown Weapon',
-                    'damage': '1d6',
-                    'ability': 'str',
-                    'damage_type': 'bludgeoning'
-                }
-                for field in missing_fields:
-                    weapon_data[field] = defaults.get(field, 'unknown')
+                weapon_data = UNARMED_STRIKE
+            elif isinstance(weapon_data, dict):
+                # Legacy dict weapons; missing fields are defaulted
+                weapon_data = WeaponData.from_dict(weapon_data)
             
             print(f"\n--- {attacker.name} attacks {target.name} ---")
             
             # Range validation
-            weapon_name = weapon_data.get('name', 'unarmed strike')
-            weapon_range = weapon_data.get('range', WeaponRanges.get_weapon_range(weapon_name))
+            weapon_name = weapon_data.name
+            weapon_range = weapon_data.range
+            if weapon_range is None:
+                weapon_range = WeaponRanges.get_weapon_range(weapon_name)
             
             # Check if target is in range
             range_check = RangeSystem.check_range(attacker, target, weapon_range)
@@ -172,39 +310,38 @@ class AttackSystem:
             target_ac = cover_ac
             
             # Determine proficiency
-            weapon_name = weapon_data.get('name', 'weapon')
-            is_proficient = weapon_data.get('proficient', False) or weapon_name.lower() in attacker.proficiencies
+            is_proficient = weapon_data.proficient or weapon_name.lower() in attacker.proficiencies
             
             # Determine total disadvantage
             has_disadvantage = has_range_disadvantage or has_close_combat_disadvantage
             
             # Make the attack roll with range and cover considerations
-            hit = perform_d20_test(
+            hit, is_crit = perform_d20_test(
                 creature=attacker,
-                ability_name=weapon_data.get('ability', 'str'),
+                ability_name=weapon_data.ability,
                 check_type=weapon_name.lower() if is_proficient else None,
                 target=target,
                 ac=target_ac,  # Use cover-modified AC
                 is_attack_roll=True,
                 has_disadvantage=has_disadvantage,
-                attacker_is_within_5_feet=attacker_is_within_5_feet
+                attacker_is_within_5_feet=attacker_is_within_5_feet,
+                return_crit=True
             )
             
             if hit:
                 # Calculate and apply damage
-                is_crit = was_last_roll_critical()
                 damage = AttackSystem._calculate_damage(
-                    weapon_data.get('damage', '1d6'), 
-                    attacker.get_ability_modifier(weapon_data.get('ability', 'str')), 
-                    is_crit
+                    weapon_data.damage, 
+                    attacker.get_ability_modifier(weapon_data.ability), 
+                    is_crit,
+                    damage_spec
                 )
-                damage_type = weapon_data.get('damage_type', 'bludgeoning')
+                damage_type = weapon_data.damage_type
                 
                 AttackSystem._deal_damage(target, damage, damage_type, attacker, is_crit)
                 
                 # Handle special effects
-                special_effects = weapon_data.get('special_effects', [])
-                for effect in special_effects:
+                for effect in weapon_data.special_effects:
                     AttackSystem._apply_weapon_effect(effect, attacker, target)
                     
                 return True
@@ -217,6 +354,40 @@ class AttackSystem:
             print(f"  > ERROR: Attack failed - {str(e)}")
             return False
     
+    @staticmethod
+    def make_weapon_attack_batch(attacker, target, weapon_data, n, has_advantage=False, has_disadvantage=False):
+        """
+        Roll n independent weapon attacks for statistics such as hit and crit rates.
+        Nothing is printed and no damage is applied; range, cover and conditions are
+        not considered. Returns (hits, crits, total_damage).
+        """
+        if not weapon_data:
+            weapon_data = UNARMED_STRIKE
+        elif isinstance(weapon_data, dict):
+            weapon_data = WeaponData.from_dict(weapon_data)
+        
+        # Same bonus perform_d20_test adds for a weapon attack
+        ability_modifier = attacker.get_ability_modifier(weapon_data.ability)
+        attack_bonus = ability_modifier
+        if weapon_data.name.lower() in attacker.proficiencies:
+            attack_bonus += attacker.proficiency_bonus
+        target_ac = target.ac
+        
+        try:
+            num_dice, die_type, dice_modifier = parse_dice_notation(weapon_data.damage)
+        except ValueError:
+            # Unrollable damage deals the minimum, as in _calculate_damage
+            num_dice, die_type, dice_modifier, ability_modifier = 0, 1, 0, 0
+        advantage = int(bool(has_advantage)) - int(bool(has_disadvantage))
+        
+        damage_bonus = dice_modifier + ability_modifier
+        if n >= _PARALLEL_MIN_ATTACKS and _roll_weapon_attacks_parallel is not None:
+            # Chunk seeds come from the shared generator, so seed_dice replays the batch
+            chunk_seeds = get_rng().integers(0, 2**32, size=-(-n // _PARALLEL_CHUNK_SIZE))
+            return _roll_weapon_attacks_parallel(n, attack_bonus, target_ac, num_dice, die_type,
+                                                 damage_bonus, advantage, chunk_seeds)
+        return _roll_weapon_attacks(n, attack_bonus, target_ac, num_dice, die_type, damage_bonus, advantage)
+    
     @staticmethod
     def make_spell_attack(caster, target, spell, spell_level=None):
         """Make a spell attack with enhanced error handling."""
@@ -253,17 +424,17 @@ class AttackSystem:
                 return {'hit': False, 'critical': False}
             target_ac = cover_ac
             
-            hit = perform_d20_test(
+            hit, is_crit = perform_d20_test(
                 creature=caster,
                 ability_name=caster.spellcasting_ability,
                 check_type=None,
                 target=target,
                 ac=target_ac,  # Use cover-modified AC
-                is_attack_roll=True
+                is_attack_roll=True,
+                return_crit=True
             )
             
             if hit:
-                is_crit = was_last_roll_critical()
                 if is_crit:
                     print(f"  > CRITICAL HIT! {spell.name} critically strikes {target.name}!")
                 else:
@@ -282,21 +453,19 @@ class AttackSystem:
     @staticmethod
     def make_unarmed_attack(attacker, target):
         """Make an unarmed strike with enhanced error handling."""
-        unarmed_data = {
-            'name': 'Unarmed Strike',
-            'damage': '1+0',
-            'ability': 'str',
-            'proficient': True,
-            'damage_type': 'bludgeoning'
-        }
-        
-        return AttackSystem.make_weapon_attack(attacker, target, unarmed_data)
+        return AttackSystem.make_weapon_attack(attacker, target, UNARMED_STRIKE)
     
     @staticmethod
-    def _calculate_damage(damage_dice, ability_modifier, is_critical=False):
+    def _calculate_damage(damage_dice, ability_modifier, is_critical=False, damage_spec=None):
         """Calculate damage with enhanced error handling."""
         try:
-            if is_critical:
+            if damage_spec is not None:
+                num_dice, die_type, dice_modifier = damage_spec
+                if is_critical:
+                    # For crits, double the dice but not the modifiers
+                    num_dice *= 2
+                base_damage = roll_parsed_dice(num_dice, die_type, dice_modifier)
+            elif is_critical:
                 # For crits, double the dice but not the ability modifier
                 import re
                 match = re.match(r'(\d+)d(\d+)([+-]\d+)?', damage_dice.lower().strip())
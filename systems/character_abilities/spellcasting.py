@@ -1,8 +1,8 @@
 # File: systems/character_abilities/spellcasting.py
 """Global spellcasting abilities system with improved validation."""
 
-from core.utils import get_ability_modifier
 from actions.spell_actions import CastSpellAction
+from creatures.base import ABILITY_INDEX
 
 class SpellcastingManager:
     """Manages spellcasting abilities for any creature."""
@@ -19,8 +19,8 @@ class SpellcastingManager:
         def get_spellcasting_modifier():
             """Get the spellcasting ability modifier with validation."""
             try:
-                ability_score = creature.stats.get(creature.spellcasting_ability, 10)
-                return get_ability_modifier(ability_score)
+                # Creatures keep their modifiers precomputed; `stats` builds a new dict on every access
+                return creature.ability_modifiers[ABILITY_INDEX[creature.spellcasting_ability]]
             except (AttributeError, KeyError):
                 print(f"Warning: {creature.name} has invalid spellcasting ability '{creature.spellcasting_ability}'. Using 0.")
                 return 0
@@ -88,7 +88,7 @@ class SpellcastingManager:
         # Check spellcasting ability
         if not hasattr(creature, 'spellcasting_ability'):
             issues.append("Missing spellcasting_ability")
-        elif creature.spellcasting_ability not in creature.stats:
+        elif creature.spellcasting_ability not in ABILITY_INDEX:
             issues.append(f"Invalid spellcasting ability '{creature.spellcasting_ability}'")
         
         # Check proficiency bonus
@@ -96,7 +96,7 @@ class SpellcastingManager:
             issues.append("Missing proficiency_bonus")
         
         # Check stats
-        if not hasattr(creature, 'stats') or not creature.stats:
+        if not getattr(creature, 'ability_scores', None):
             issues.append("Missing or empty stats")
         
         if issues:
@@ -1,8 +1,11 @@
 # File: systems/d20_system.py
 """Global system for handling all D20 Tests."""
+import logging
 from core.utils import roll_d20
 from systems.condition_system import has_condition
 
+logger = logging.getLogger('dnd.rolls')
+
 # Global variable to track the last roll result for critical detection
 _last_d20_result = None
 
@@ -20,7 +23,8 @@ def perform_d20_test(
     is_attack_roll=False,
     is_influence_check=False,
     social_interaction_type=None,
-    override_social_dc=None
+    override_social_dc=None,
+    return_crit=False
 ):
     """
     Performs a generic D20 Test with integrated social interaction mechanics.
@@ -28,6 +32,7 @@ def perform_d20_test(
     Args:
         social_interaction_type: Type of social interaction ("persuasion", "intimidation", "deception", etc.)
         override_social_dc: Manual DC override for social interactions
+        return_crit: Return (success, is_natural_20) instead of just success
     """
     global _last_d20_result
     
@@ -39,10 +44,10 @@ def perform_d20_test(
             attitude_modifier = _get_attitude_modifier(target.attitude, social_interaction_type)
             original_dc = dc
             dc += attitude_modifier
-            print(f"  > Social DC: {original_dc} (base) {attitude_modifier:+d} (attitude) = {dc}")
+            logger.debug("  > Social DC: %s (base) %+d (attitude) = %s", original_dc, attitude_modifier, dc)
         elif override_social_dc is not None:
             dc = override_social_dc
-            print(f"  > Using override social DC: {dc}")
+            logger.debug("  > Using override social DC: %s", dc)
         
         # Set influence check flag for compatibility
         is_influence_check = True
@@ -51,43 +56,43 @@ def perform_d20_test(
     # Check the target's attitude if this is an influence check.
     if is_influence_check and target:
         if target.attitude == 'Friendly':
-            print(f"  > Target ({target.name}) is Friendly, granting Advantage.")
+            logger.debug("  > Target (%s) is Friendly, granting Advantage.", target.name)
             has_advantage = True
         elif target.attitude == 'Hostile':
-            print(f"  > Target ({target.name}) is Hostile, imposing Disadvantage.")
+            logger.debug("  > Target (%s) is Hostile, imposing Disadvantage.", target.name)
             has_disadvantage = True
             
     # Advantage/Disadvantage from conditions and combat states
     if target and has_condition(target, 'prone'):
         if attacker_is_within_5_feet:
-            print(f"  > Target ({target.name}) is Prone and attacker is within 5ft, imposing Advantage.")
+            logger.debug("  > Target (%s) is Prone and attacker is within 5ft, imposing Advantage.", target.name)
             has_advantage = True
         else:
-            print(f"  > Target ({target.name}) is Prone and attacker is at range, imposing Disadvantage.")
+            logger.debug("  > Target (%s) is Prone and attacker is at range, imposing Disadvantage.", target.name)
             has_disadvantage = True
 
     if has_condition(creature, 'prone'):
-        print(f"  > {creature.name} is Prone and has Disadvantage on the attack roll.")
+        logger.debug("  > %s is Prone and has Disadvantage on the attack roll.", creature.name)
         has_disadvantage = True
 
     can_benefit_from_dodge = creature.is_dodging and not has_condition(creature, 'incapacitated') and creature.speed > 0
     if can_benefit_from_dodge and is_saving_throw and ability_name.lower() == 'dex':
-        print(f"  > {creature.name} is Dodging, gaining Advantage on the Dexterity save.")
+        logger.debug("  > %s is Dodging, gaining Advantage on the Dexterity save.", creature.name)
         has_advantage = True
 
     if target and target.is_dodging and not has_condition(target, 'incapacitated') and target.speed > 0:
-        print(f"  > Target ({target.name}) is Dodging, imposing Disadvantage on the attack.")
+        logger.debug("  > Target (%s) is Dodging, imposing Disadvantage on the attack.", target.name)
         has_disadvantage = True
         
-    if target and creature.help_effects.get('attack_advantage_against') == target:
-        print(f"  > {creature.name} has help attacking {target.name}, gaining Advantage.")
+    if target and getattr(creature, 'help_attack_target', None) is target:
+        logger.debug("  > %s has help attacking %s, gaining Advantage.", creature.name, target.name)
         has_advantage = True
-        creature.help_effects['attack_advantage_against'] = None
+        creature.help_attack_target = None
 
-    if check_type and creature.help_effects.get('ability_check_advantage_on') == check_type.lower():
-        print(f"  > {creature.name} has help with a '{check_type}' check, gaining Advantage.")
+    if check_type and getattr(creature, 'help_skill', None) == check_type.lower():
+        logger.debug("  > %s has help with a '%s' check, gaining Advantage.", creature.name, check_type)
         has_advantage = True
-        creature.help_effects['ability_check_advantage_on'] = None
+        creature.help_skill = None
 
     target_number = dc if dc is not None else (target.ac if target else ac)
     if target_number is None:
@@ -98,65 +103,65 @@ def perform_d20_test(
         roll1, roll2 = roll_d20(), roll_d20()
         d20_result = max(roll1, roll2)
         _last_d20_result = d20_result  # Track for critical detection
-        print(f"  > Rolling with Advantage: got {roll1}, {roll2}. Using {d20_result}")
+        logger.debug("  > Rolling with Advantage: got %s, %s. Using %s", roll1, roll2, d20_result)
     elif has_disadvantage and not has_advantage:
         roll1, roll2 = roll_d20(), roll_d20()
         d20_result = min(roll1, roll2)
         _last_d20_result = d20_result  # Track for critical detection
-        print(f"  > Rolling with Disadvantage: got {roll1}, {roll2}. Using {d20_result}")
+        logger.debug("  > Rolling with Disadvantage: got %s, %s. Using %s", roll1, roll2, d20_result)
     else:
         if has_advantage and has_disadvantage:
-            print("  > Advantage & Disadvantage cancel. Rolling normally.")
+            logger.debug("  > Advantage & Disadvantage cancel. Rolling normally.")
         d20_result = roll_d20()
         _last_d20_result = d20_result  # Track for critical detection
-        print(f"  > Rolling 1d20: got {d20_result}")
+        logger.debug("  > Rolling 1d20: got %s", d20_result)
 
     # Handle special attack roll outcomes
     if is_attack_roll:
         if d20_result == 20:
-            print("  > Natural 20! Automatic Hit!")
-            return True
+            logger.debug("  > Natural 20! Automatic Hit!")
+            return (True, True) if return_crit else True
         if d20_result == 1:
-            print("  > Natural 1! Automatic Miss!")
-            return False
+            logger.debug("  > Natural 1! Automatic Miss!")
+            return (False, False) if return_crit else False
 
     # Calculate final total with proper proficiency handling
     ability_modifier = creature.get_ability_modifier(ability_name)
     
     # --- ENHANCED: Proper proficiency bonus calculation ---
     proficiency_bonus = 0
-    prof_text = ""
     
     if is_saving_throw:
         # For saving throws, check for saving throw proficiencies
         save_prof_name = f"{ability_name}_save"  # e.g., "dex_save", "con_save"
         if save_prof_name in creature.proficiencies:
             proficiency_bonus = creature.proficiency_bonus
-            prof_text = f"+ {proficiency_bonus} (save prof)"
+            prof_label = "save prof"
         else:
-            prof_text = "+ 0 (no save prof)"
+            prof_label = "no save prof"
     elif check_type:
         # For skill checks, check for skill proficiencies
         if check_type.lower() in creature.proficiencies:
             proficiency_bonus = creature.proficiency_bonus
-            prof_text = f"+ {proficiency_bonus} (skill prof)"
+            prof_label = "skill prof"
         else:
-            prof_text = "+ 0 (no skill prof)"
+            prof_label = "no skill prof"
     else:
         # For ability checks without specific skills
-        prof_text = "+ 0 (ability check)"
+        prof_label = "ability check"
     
     total = d20_result + ability_modifier + proficiency_bonus
     
-    print(f"  > Total: {d20_result} (roll) + {ability_modifier} ({ability_name}) {prof_text} = {total}")
+    logger.debug("  > Total: %s (roll) + %s (%s) + %s (%s) = %s",
+                 d20_result, ability_modifier, ability_name, proficiency_bonus, prof_label, total)
 
     # Compare to the target number
     if total >= target_number:
-        print(f"  > Success! ({total} vs DC/AC {target_number})")
-        return True
+        logger.debug("  > Success! (%s vs DC/AC %s)", total, target_number)
+        return (True, d20_result == 20) if return_crit else True
     else:
-        print(f"  > Failure. ({total} vs DC/AC {target_number})")
-        return False
+        logger.debug("  > Failure. (%s vs DC/AC %s)", total, target_number)
+        return (False, d20_result == 20) if return_crit else False
 
 def was_last_roll_critical():
     """Check if the last d20 roll was a natural 20."""
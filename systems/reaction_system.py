@@ -7,16 +7,16 @@ def check_for_triggers(event_description, potential_reactors):
     print("  > Checking for reactions...")
 
     for reactor in potential_reactors:
-        if reactor.readied_action.get('trigger') == event_description:
+        if reactor.readied_trigger == event_description:
             print(f"  > {reactor.name}'s trigger matches! They use their Reaction.")
             
-            action = reactor.readied_action['action']
+            action = reactor.readied_action_obj
             if hasattr(action, 'execute'):
                 # Simplified execution for testing purposes.
                 action.execute(reactor)
 
             # Clear the readied action after use.
-            reactor.readied_action = {'trigger': None, 'action': None, 'target': None}
+            reactor.clear_readied_action()
             return # Only one reaction per event in this simple model.
             
     print("  > No readied actions were triggered.")
\ No newline at end of file
@@ -41,19 +41,16 @@ class AdvancedSpellSystem:
             print(f"  > {caster.name} is not a spellcaster!")
             return {'hit': False, 'critical': False}
         
-        # Make the attack roll using d20 system
-        hit = perform_d20_test(
+        # Make the attack roll using d20 system; a natural 20 is a critical hit
+        hit, is_critical = perform_d20_test(
             creature=caster,
             ability_name=caster.spellcasting_ability,
             check_type=None,  # Spell attacks don't use skill proficiency
             target=target,
-            is_attack_roll=True
+            is_attack_roll=True,
+            return_crit=True
         )
         
-        # Check for critical hit (natural 20)
-        from systems.d20_system import was_last_roll_critical
-        is_critical = was_last_roll_critical()
-        
         if hit:
             if is_critical:
                 print(f"  > CRITICAL HIT! {spell.name} strikes {target.name}!")
@@ -5,11 +5,28 @@ from core.utils import roll_d20, get_ability_modifier
 from systems.d20_system import perform_d20_test
 from systems.cover_system import RangeSystem, CoverSystem
 from systems.positioning_system import battlefield
+from functools import singledispatch
 import logging
 
 # Set up logging
 logger = logging.getLogger('SpellSystem')
 
+
+@singledispatch
+def _iter_targets(targets):
+    """Yield the individual targets of a spell; a lone creature or object targets itself."""
+    return (targets,)
+
+@_iter_targets.register(list)
+@_iter_targets.register(tuple)
+def _(targets):
+    return targets
+
+@_iter_targets.register(type(None))
+def _(targets):
+    return ()
+
+
 class SpellManager:
     """Central manager for all spell casting operations with enhanced error handling."""
 
@@ -56,7 +73,7 @@ class SpellManager:
                 spell_range = SpellManager._parse_spell_range(spell.range_type)
                 
                 # Check each target individually
-                for target in (targets if isinstance(targets, list) else [targets]):
+                for target in _iter_targets(targets):
                     if target == caster:  # Self-targeting is always valid
                         continue
                         